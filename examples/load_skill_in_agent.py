@@ -17,7 +17,9 @@ Run from the project root:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
 import anthropic
 
@@ -39,12 +41,14 @@ AGENT_ID = "loan-processor-agent-prod"
 # Step 1 — Load the skill with access control enforcement
 # ---------------------------------------------------------------------------
 
-def load_skill(skill_id: str, agent_id: str) -> dict:
+def load_skill(skill_id: str, agent_id: str) -> Mapping[str, Any]:
     """Load a skill from the registry, enforcing all three access-control layers.
 
     Layer 1 — Status gate:   only approved skills load.
     Layer 2 — Allowlist gate: agent_id must be in authorised_agents.
     Layer 3 — Schema gate:   invalid skills are excluded at registry load time.
+
+    The returned skill is read-only; pass it to thaw() for a mutable copy.
     """
     registry = SkillRegistry()
 
@@ -68,7 +72,7 @@ def load_skill(skill_id: str, agent_id: str) -> dict:
 # Step 2 — Read the generated SKILL.md as the agent's instruction document
 # ---------------------------------------------------------------------------
 
-def read_skill_instructions(skill_data: dict) -> str:
+def read_skill_instructions(skill_data: Mapping[str, Any]) -> str:
     """Return the contents of SKILL.md — the agent's runtime instruction document.
 
     SKILL.md is generated from skill.yml by `supv render` and contains the
@@ -92,7 +96,7 @@ def read_skill_instructions(skill_data: dict) -> str:
 # Step 3 — Run an agent session with the skill loaded
 # ---------------------------------------------------------------------------
 
-def run_agent_session(skill_data: dict, task: str) -> None:
+def run_agent_session(skill_data: Mapping[str, Any], task: str) -> None:
     """Start an agent session using SKILL.md as the system prompt.
 
     The supervisor's procedure is embedded directly in the agent's instructions.
@@ -8,7 +8,7 @@ import sys
 import click
 from rich.console import Console
 
-from supervisory_procedures.core.registry import SkillRegistry
+from supervisory_procedures.core.registry import SkillRegistry, thaw
 from supervisory_procedures.core.access_control import SkillNotFoundError
 
 console = Console()
@@ -39,6 +39,6 @@ def export(skill_id: str, registry: str | None) -> None:
     envelope = {
         "export_format": "supervisory-skill-v1",
         "skill_id": skill_data.get("metadata", {}).get("id", "unknown"),
-        "skill": skill_data,
+        "skill": thaw(skill_data),
     }
     click.echo(json.dumps(envelope, indent=2, ensure_ascii=False, default=str))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import itemgetter
 from pathlib import Path
 
 import click
@@ -18,6 +19,15 @@ _STATUS_COLOUR = {
     "draft": "yellow",
     "deprecated": "dim",
 }
+_RISK_COLOUR = {"low": "green", "medium": "yellow", "high": "red", "critical": "bold red"}
+
+# Pre-rendered markup for the fixed status / risk vocabularies
+_STATUS_CELL = {s: f"[{c}]{s}[/{c}]" for s, c in _STATUS_COLOUR.items()}
+_RISK_CELL = {r: f"[{c}]{r}[/{c}]" for r, c in _RISK_COLOUR.items()}
+
+# Registry summaries are built from validated metadata plus risk_classification,
+# so every key here is always present
+_row_fields = itemgetter("id", "name", "status", "risk_classification", "version", "supervisor")
 
 
 @click.command()
@@ -66,15 +76,13 @@ def list_skills(business_area: str | None, status: str | None, registry: str | N
     table.add_column("Supervisor")
 
     for meta in skills:
-        skill_status = meta.get("status", "")
-        colour = _STATUS_COLOUR.get(skill_status, "white")
-        supervisor = meta.get("supervisor", {})
+        sid, sname, sstatus, srisk, sver, supervisor = _row_fields(meta)
         table.add_row(
-            meta.get("id", ""),
-            meta.get("name", ""),
-            f"[{colour}]{skill_status}[/{colour}]",
-            _risk_cell(meta.get("risk_classification", "")),
-            meta.get("version", ""),
+            sid,
+            sname,
+            _status_cell(sstatus),
+            _risk_cell(srisk),
+            sver,
             supervisor.get("name", ""),
         )
 
@@ -82,7 +90,13 @@ def list_skills(business_area: str | None, status: str | None, registry: str | N
     console.print(f"[dim]{len(skills)} skill(s)[/dim]")
 
 
+def _status_cell(status: str) -> str:
+    cell = _STATUS_CELL.get(status)
+    return cell if cell is not None else f"[white]{status}[/white]"
+
+
 def _risk_cell(risk: str) -> str:
-    colours = {"low": "green", "medium": "yellow", "high": "red", "critical": "bold red"}
-    colour = colours.get(risk, "white")
-    return f"[{colour}]{risk}[/{colour}]" if risk else ""
+    cell = _RISK_CELL.get(risk)
+    if cell is not None:
+        return cell
+    return f"[white]{risk}[/white]" if risk else ""
@@ -49,13 +49,13 @@ def render(skill_id: str, registry: str | None, stdout: bool) -> None:
         err_console.print(f"[red]Skill '{skill_id}' not found in registry.[/red]")
         sys.exit(1)
 
+    skill_dir = Path(skill_data["_skill_dir"])
     content = render_skill_md(skill_data)
 
     if stdout:
         click.echo(content, nl=False)
         return
 
-    skill_dir = Path(skill_data["_skill_dir"])
     out_path = skill_dir / "SKILL.md"
     out_path.write_text(content)
     console.print(f"[green]✓[/green] Rendered [bold]{out_path}[/bold]")
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Mapping
+from typing import Any
 
 import click
 import yaml
@@ -10,7 +12,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-from supervisory_procedures.core.registry import SkillRegistry
+from supervisory_procedures.core.registry import SkillRegistry, thaw
 from supervisory_procedures.core.access_control import SkillNotFoundError
 
 console = Console()
@@ -46,7 +48,7 @@ def show(skill_id: str, registry: str | None, raw: bool) -> None:
         sys.exit(1)
 
     if raw:
-        click.echo(yaml.dump(skill_data, sort_keys=False, allow_unicode=True))
+        click.echo(yaml.dump(thaw(skill_data), sort_keys=False, allow_unicode=True))
         return
 
     _render_skill(skill_data)
@@ -63,8 +65,7 @@ _CLASSIFICATION_COLOUR = {
 _RISK_COLOUR = {"low": "green", "medium": "yellow", "high": "red", "critical": "bold red"}
 _STATUS_COLOUR = {"approved": "green", "draft": "yellow", "deprecated": "dim"}
 
-
-def _render_skill(data: dict) -> None:
+def _render_skill(data: Mapping[str, Any]) -> None:
     meta = data.get("metadata", {})
     ctx = data.get("context", {})
     scope = data.get("scope", {})
@@ -72,7 +73,13 @@ def _render_skill(data: dict) -> None:
     control_points = data.get("control_points", [])
     workflow_steps = data.get("workflow", {}).get("steps", [])
 
+    sid = meta.get("id", "")
+    name = meta.get("name", "")
+    version = meta.get("version", "")
     status = meta.get("status", "")
+    created_at = meta.get("created_at", "")
+    sup = meta.get("supervisor", {})
+    agents = meta.get("authorised_agents", [])
     status_colour = _STATUS_COLOUR.get(status, "white")
 
     # Header
@@ -80,10 +87,10 @@ def _render_skill(data: dict) -> None:
     console.print(
         Panel(
             Text.from_markup(
-                f"[bold]{meta.get('name', '')}[/bold]  "
-                f"v{meta.get('version', '')}  "
+                f"[bold]{name}[/bold]  "
+                f"v{version}  "
                 f"[{status_colour}][{status}][/{status_colour}]\n"
-                f"[dim]{meta.get('id', '')}[/dim]"
+                f"[dim]{sid}[/dim]"
             ),
             title="Agent Skill",
             border_style="blue",
@@ -91,12 +98,11 @@ def _render_skill(data: dict) -> None:
     )
 
     # Supervisor + dates
-    sup = meta.get("supervisor", {})
     console.print(f"[bold]Supervisor:[/bold] {sup.get('name', '')} ({sup.get('role', '')}) — {sup.get('email', '')}")
-    console.print(f"[bold]Created:[/bold] {meta.get('created_at', '')}")
+    console.print(f"[bold]Created:[/bold] {created_at}")
     if meta.get("approved_at"):
         console.print(f"[bold]Approved:[/bold] {meta['approved_at']} by {meta.get('approved_by', '')}")
-    console.print(f"[bold]Authorised agents:[/bold] {', '.join(meta.get('authorised_agents', []))}")
+    console.print(f"[bold]Authorised agents:[/bold] {', '.join(agents)}")
 
     # Context
     console.print()
@@ -28,18 +28,26 @@ err_console = Console(stderr=True)
     default=False,
     help="Treat warnings (e.g. wildcard agents) as errors.",
 )
-def validate(path: str, strict: bool) -> None:
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    default=False,
+    help="Stop at the first invalid skill when validating a directory.",
+)
+def validate(path: str, strict: bool, fail_fast: bool) -> None:
     """Validate skill YAML file(s) against the JSON Schema.
 
     PATH may be a single .yml file or a directory (searched recursively).
-    Exits with code 1 if any skill fails validation.
+    Exits with code 1 if any skill fails validation. With --fail-fast, a
+    directory sweep stops at the first failure; skills already validated are
+    still reported.
     """
     target = Path(path)
 
     if target.is_file():
         _validate_single(target, strict)
     else:
-        _validate_directory(target, strict)
+        _validate_directory(target, strict, fail_fast)
 
 
 def _validate_single(path: Path, strict: bool) -> None:
@@ -58,8 +66,8 @@ def _validate_single(path: Path, strict: bool) -> None:
         sys.exit(1)
 
 
-def _validate_directory(directory: Path, strict: bool) -> None:
-    successes, failures = validate_directory(directory, strict=strict)
+def _validate_directory(directory: Path, strict: bool, fail_fast: bool) -> None:
+    successes, failures = validate_directory(directory, strict=strict, fail_fast=fail_fast)
 
     if not successes and not failures:
         console.print(f"[yellow]No .yml files found under {directory}[/yellow]")
@@ -97,6 +105,7 @@ def _validate_directory(directory: Path, strict: bool) -> None:
     console.print(
         f"\n[bold]{len(successes)}/{total}[/bold] skills passed validation"
         + (" (strict mode)" if strict else "")
+        + (" — stopped at first failure" if fail_fast and failures else "")
     )
 
     if failures:
@@ -2,38 +2,100 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 import sys
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 import click
-import questionary
-import yaml
-from rich.console import Console
-from rich.syntax import Syntax
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
+from rich.rule import Rule
+from rich.text import Text
+
+from supervisory_procedures.core.validator import (
+    ValidationError,
+    validate_skill_data,
+)
 
 console = Console()
 err_console = Console(stderr=True)
 
+# Decide once whether step rules are drawn or logged as plain lines
+_IS_TTY = console.is_terminal
+
 _DEFAULT_REGISTRY = Path(__file__).parent.parent.parent / "registry"
 
-_RISK_LEVELS = ["low", "medium", "high", "critical"]
-_CLASSIFICATIONS = ["auto", "notify", "review", "needs_approval", "vetoed"]
+# Constant choice sets are tuples so their questionary Choices can be cached
+_RISK_LEVELS = ("low", "medium", "high", "critical")
+_CLASSIFICATIONS = ("auto", "notify", "review", "needs_approval", "vetoed")
+_ACTIVATIONS = ("conditional", "step")
+
+# Above this many activities, the workflow step prompt switches from a
+# scrolling select to type-to-search autocomplete
+_AUTOCOMPLETE_THRESHOLD = 20
+
+_YAML_DUMP_OPTS: dict[str, Any] = {
+    "sort_keys": False,
+    "allow_unicode": True,
+    "default_flow_style": False,
+}
+
+_SLUG_KEEP = "abcdefghijklmnopqrstuvwxyz0123456789-"
+_SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_BA_SLUG = re.compile(r"[^a-z0-9_]")
+# Same shape as the schema's metadata.id pattern; checked before the id is used as a path
+_SKILL_ID_RE = re.compile(r"[a-z0-9_]+/[a-z0-9_-]+")
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+class _SlugTable(dict[int, str | None]):
+    """``str.translate`` table for ``_slug``: keeps ``[a-z0-9-]``, maps whitespace
+    to ``-`` and drops everything else. Code points are classified on first sight."""
+
+    def __missing__(self, codepoint: int) -> str | None:
+        char = chr(codepoint)
+        if char in _SLUG_KEEP:
+            mapped: str | None = char
+        elif char.isspace():
+            mapped = "-"
+        else:
+            mapped = None
+        self[codepoint] = mapped
+        return mapped
+
+
+_SLUG_TABLE = _SlugTable()
+
+
 def _slug(text: str) -> str:
     """Convert free text to a kebab-case slug."""
-    text = text.lower().strip()
-    text = re.sub(r"[^a-z0-9\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
-    return text
+    text = text.lower().translate(_SLUG_TABLE)
+    while "--" in text:  # collapse dash runs; each pass halves them
+        text = text.replace("--", "-")
+    return text.strip("-")
+
+
+def _slug_validate(value: str) -> bool | str:
+    """questionary validator: accept blank input or an already kebab-case slug."""
+    value = value.strip()
+    if not value or _SLUG_RE.match(value):
+        return True
+    return "Use kebab-case: lowercase letters, digits and single dashes."
+
+
+def _sla_validate(value: str) -> bool | str:
+    """questionary validator: accept blank input or a whole number of hours >= 1."""
+    value = value.strip()
+    if not value or (value.isascii() and value.isdigit() and int(value) >= 1):
+        return True
+    return "Enter a whole number of hours (1 or more), or leave blank."
 
 
 def _q(fn: Any, *args: Any, **kwargs: Any) -> Any:
@@ -44,31 +106,143 @@ def _q(fn: Any, *args: Any, **kwargs: Any) -> Any:
     return val
 
 
+# questionary (prompt_toolkit), yaml and rich.syntax (Pygments) are imported
+# lazily so other `supv` subcommands don't pay for them at startup.
+
 def _ask(question: str, **kwargs: Any) -> str:
+    import questionary
+
     return _q(questionary.text, question, **kwargs).strip()
 
 
-def _ask_select(question: str, choices: list[str]) -> str:
-    return _q(questionary.select, question, choices=choices)
+@functools.lru_cache(maxsize=8)
+def _prebuilt_choices(options: tuple[str, ...]) -> list[Any]:
+    """Build questionary Choices for a constant choice set once per process.
+
+    Bounded: only the handful of module-level choice tuples are meant to hit it.
+    """
+    import questionary
+
+    return [questionary.Choice(o) for o in options]
+
+
+def _ask_select(question: str, choices: Sequence[str]) -> str:
+    import questionary
+
+    answer: str
+    if isinstance(choices, tuple):
+        answer = _q(questionary.select, question, choices=_prebuilt_choices(choices))
+    else:
+        answer = _q(questionary.select, question, choices=choices)
+    return answer
+
+
+def _ask_autocomplete(question: str, choices: Sequence[str]) -> str:
+    """Free-text prompt with completion; only accepts one of choices."""
+    import questionary
+
+    valid = frozenset(choices)
+    answer: str = _q(
+        questionary.autocomplete,
+        question,
+        choices=list(choices),
+        match_middle=True,
+        validate=lambda v: v in valid or "Select one of the listed options.",
+    )
+    return answer
 
 
 def _ask_confirm(question: str, default: bool = False) -> bool:
+    import questionary
+
     return _q(questionary.confirm, question, default=default)
 
 
+def _rule(text: str) -> Rule | Text:
+    """A full-width rule on a terminal; a plain ``--- text ---`` line when piped."""
+    title = Text.from_markup(text)
+    return Rule(title) if _IS_TTY else Text.assemble("--- ", title, " ---")
+
+
+_STEP_TITLES = [
+    "Business Area",
+    "Skill Name & Version",
+    "Supervisor Details",
+    "Context",
+    "Approved Activities",
+    "Constraints",
+    "Control Points",
+    "Workflow Steps",
+]
+_FINAL_STEP = 0
+
+# Step header renderables, built (and their markup parsed) once at import
+_STEP_HEADERS: dict[int, Rule | Text] = {
+    n: _rule(f"[bold cyan]Step {n} / {len(_STEP_TITLES)} — {title}[/bold cyan]")
+    for n, title in enumerate(_STEP_TITLES, start=1)
+}
+_STEP_HEADERS[_FINAL_STEP] = _rule("[bold cyan]Final Step — Authorised Agents & Save[/bold cyan]")
+
+
+def _step_header(step: int, intro: str | None = None) -> None:
+    """Print a step's rule and static intro text as a single Rich render."""
+    rule = _STEP_HEADERS[step]
+    console.print(Group(rule, Text.from_markup(intro)) if intro else rule)
+
+
+# Typed as the first item of a list prompt, opens $EDITOR for bulk entry
+_BULK_EDIT = ":edit"
+
+
+def _edit_list(prompt: str) -> list[str]:
+    """Open $EDITOR once and return its non-blank, non-comment lines as items."""
+    template = f"# {prompt}\n# One item per line. Lines starting with '#' are ignored.\n"
+    text = click.edit(template) or ""
+    return [
+        line.strip() for line in text.splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+
+
 def _collect_list(prompt: str, min_items: int = 1) -> list[str]:
-    """Prompt the user to enter items one at a time until they enter a blank line."""
-    items: list[str] = []
-    console.print(f"[bold]{prompt}[/bold] (enter each item, blank line when done)")
+    """Prompt the user for a list of items.
+
+    Items are entered one at a time until a blank line. Typing :edit as the
+    first item opens $EDITOR instead, to paste items one per line; if that
+    yields too few, entry continues one at a time. Repeated items are dropped,
+    keeping first-entry order.
+    """
+    import questionary
+
+    items: dict[str, None] = {}  # insertion-ordered set
+    console.print(
+        f"[bold]{prompt}[/bold] (enter each item, blank line when done; "
+        f"{_BULK_EDIT} to use $EDITOR)"
+    )
+    # One question reused for every item; only its input buffer is reset
+    question = questionary.text("  →")
+    buffer = question.application.current_buffer
+    too_few = f"  [yellow]Please enter at least {min_items} item(s).[/yellow]"
     while True:
-        val = _q(questionary.text, "  →").strip()
+        buffer.reset()
+        val = question.ask()
+        if val is None:
+            sys.exit(0)
+        if val and (val[0].isspace() or val[-1].isspace()):
+            val = val.strip()
+        if val == _BULK_EDIT and not items:
+            items = dict.fromkeys(_edit_list(prompt))
+            if len(items) >= min_items:
+                break
+            console.print(too_few)
+            continue
         if not val:
             if len(items) < min_items:
-                console.print(f"  [yellow]Please enter at least {min_items} item(s).[/yellow]")
+                console.print(too_few)
                 continue
             break
-        items.append(val)
-    return items
+        items[val] = None
+    return list(items)
 
 
 # ---------------------------------------------------------------------------
@@ -77,17 +251,20 @@ def _collect_list(prompt: str, min_items: int = 1) -> list[str]:
 
 def _step_business_area(registry_path: Path) -> str:
     """Step 1 / 8 — select or create a business area."""
-    console.rule("[bold cyan]Step 1 / 8 — Business Area[/bold cyan]")
-    existing = sorted(
-        d.name for d in registry_path.iterdir() if d.is_dir() and not d.name.startswith(".")
-    ) if registry_path.exists() else []
+    _step_header(1)
+    try:
+        # DirEntry.is_dir() reuses the d_type from the directory read — no stat per entry
+        with os.scandir(registry_path) as it:
+            existing = sorted(e.name for e in it if e.is_dir() and not e.name.startswith("."))
+    except FileNotFoundError:
+        existing = []
 
     choices = existing + ["+ Create new business area"]
     selected = _ask_select("Select business area:", choices)
 
     if selected == "+ Create new business area":
         name = _ask("New business area name (e.g. commercial_lending):")
-        slug_name = re.sub(r"[^a-z0-9_]", "_", name.lower())
+        slug_name = _BA_SLUG.sub("_", name.lower())
         console.print(f"  → Will create: [cyan]{slug_name}[/cyan]")
         return slug_name
     return selected
@@ -95,7 +272,7 @@ def _step_business_area(registry_path: Path) -> str:
 
 def _step_name_version(business_area: str) -> tuple[str, str, str, str]:
     """Step 2 / 8 — skill name, version, id."""
-    console.rule("[bold cyan]Step 2 / 8 — Skill Name & Version[/bold cyan]")
+    _step_header(2)
     name = _ask("Skill name (display name):")
     version = _ask("Version:", default="1.0.0")
     suggested_id = f"{business_area}/{_slug(name)}"
@@ -108,7 +285,7 @@ def _step_name_version(business_area: str) -> tuple[str, str, str, str]:
 
 def _step_supervisor() -> dict[str, str]:
     """Step 3 / 8 — supervisor details."""
-    console.rule("[bold cyan]Step 3 / 8 — Supervisor Details[/bold cyan]")
+    _step_header(3)
     return {
         "name": _ask("Supervisor full name:"),
         "email": _ask("Supervisor email:"),
@@ -118,7 +295,7 @@ def _step_supervisor() -> dict[str, str]:
 
 def _step_context() -> dict[str, Any]:
     """Step 4 / 8 — context block."""
-    console.rule("[bold cyan]Step 4 / 8 — Context[/bold cyan]")
+    _step_header(4)
     description = _ask("Description (what business activity does this skill govern?):")
     rationale = _ask("Business rationale (why is AI appropriate here?):")
     regulations = _collect_list("Applicable regulations (e.g. FCA CONC 5.2):", min_items=0)
@@ -133,10 +310,10 @@ def _step_context() -> dict[str, Any]:
 
 def _step_approved_activities() -> list[dict[str, str]]:
     """Step 5 / 8 — approved activities (exhaustive allowlist)."""
-    console.rule("[bold cyan]Step 5 / 8 — Approved Activities[/bold cyan]")
-    console.print(
+    _step_header(
+        5,
         "Enter each approved activity. You'll be prompted for a description then an ID slug.\n"
-        "[dim]Audit logging is automatic — do not add an audit-log activity.[/dim]"
+        "[dim]Audit logging is automatic — do not add an audit-log activity.[/dim]",
     )
     activities: list[dict[str, str]] = []
     while True:
@@ -147,19 +324,19 @@ def _step_approved_activities() -> list[dict[str, str]]:
                 console.print("  [yellow]Please enter at least 1 activity.[/yellow]")
                 continue
             break
-        suggested_id = _slug(desc)[:40]
-        act_id = _ask(f"  ID (slug):", default=suggested_id).strip()
+        suggested_id = _slug(desc)[:40].rstrip("-")
+        act_id = _ask("  ID (slug):", default=suggested_id, validate=_slug_validate)
         activities.append({"id": act_id or suggested_id, "description": desc})
     return activities
 
 
 def _step_constraints() -> dict[str, Any]:
     """Step 6 / 8 — procedural requirements and unacceptable actions."""
-    console.rule("[bold cyan]Step 6 / 8 — Constraints[/bold cyan]")
-    console.print(
+    _step_header(
+        6,
         "[dim]Procedural requirements are cross-cutting behavioural principles only.\n"
         "Do not repeat constraints already expressed by workflow ordering, control points,\n"
-        "or unacceptable_actions.[/dim]"
+        "or unacceptable_actions.[/dim]",
     )
     requirements = _collect_list("Procedural requirements:", min_items=0)
     unacceptable = _collect_list("Unacceptable actions — what the agent must NEVER do:", min_items=1)
@@ -171,8 +348,8 @@ def _step_constraints() -> dict[str, Any]:
 
 def _step_control_points() -> list[dict[str, Any]]:
     """Step 7 / 8 — control points (unified veto + oversight model)."""
-    console.rule("[bold cyan]Step 7 / 8 — Control Points[/bold cyan]")
-    console.print(
+    _step_header(
+        7,
         "Define control points — moments where the agent must pause, notify, or halt.\n"
         "Classifications: [bold]vetoed[/bold] = halt unconditionally, "
         "[bold]needs_approval[/bold] = explicit sign-off required, "
@@ -180,16 +357,16 @@ def _step_control_points() -> list[dict[str, Any]]:
         "[bold]notify[/bold] = human informed but not blocked, "
         "[bold]auto[/bold] = agent proceeds without human involvement.\n\n"
         "Activation: [bold]conditional[/bold] = fires when a trigger condition is detected "
-        "(at any workflow step), [bold]step[/bold] = fires when referenced by a specific workflow step."
+        "(at any workflow step), [bold]step[/bold] = fires when referenced by a specific workflow step.",
     )
     control_points: list[dict[str, Any]] = []
 
     while True:
         console.print(f"\n  [bold]Control point #{len(control_points) + 1}[/bold]")
-        cp_id = _slug(_ask("  ID (slug, e.g. sanctions-match):"))
+        cp_id = _ask("  ID (slug, e.g. sanctions-match):", validate=_slug_validate)
         cp_desc = _ask("  Description:")
         classification = _ask_select("  Classification:", _CLASSIFICATIONS)
-        activation = _ask_select("  Activation:", ["conditional", "step"])
+        activation = _ask_select("  Activation:", _ACTIVATIONS)
 
         cp: dict[str, Any] = {
             "id": cp_id or f"cp-{len(control_points) + 1}",
@@ -209,8 +386,8 @@ def _step_control_points() -> list[dict[str, Any]]:
             escalation = _ask("  Escalation contact (email or team name):")
             cp["escalation_contact"] = escalation
 
-        sla_str = _ask("  SLA in hours (optional, press Enter to skip):")
-        if sla_str.isdigit():
+        sla_str = _ask("  SLA in hours (optional, press Enter to skip):", validate=_sla_validate)
+        if sla_str:
             cp["sla_hours"] = int(sla_str)
 
         control_points.append(cp)
@@ -223,25 +400,33 @@ def _step_control_points() -> list[dict[str, Any]]:
 
 def _step_workflow(approved_activities: list[dict[str, str]]) -> dict[str, Any]:
     """Step 8 / 8 — workflow steps."""
-    console.rule("[bold cyan]Step 8 / 8 — Workflow Steps[/bold cyan]")
-    console.print(
+    _step_header(
+        8,
         "Define the ordered steps the agent will execute.\n"
-        "[dim]Step ID defaults to the activity ID if left blank.[/dim]"
+        "[dim]Step ID defaults to the activity ID if left blank.[/dim]",
     )
-    choices = [f"{a['id']}  —  {a['description']}" for a in approved_activities]
-    choice_to_id = {c: a["id"] for c, a in zip(choices, approved_activities)}
+    # A tuple, so the select prompt's Choices are built once for every step
+    choices = tuple(f"{a['id']}  —  {a['description']}" for a in approved_activities)
+    choice_to_id = dict(zip(choices, [a["id"] for a in approved_activities]))
+    use_autocomplete = len(choices) > _AUTOCOMPLETE_THRESHOLD
     steps: list[dict[str, Any]] = []
 
     while True:
         console.print(f"\n  [bold]Step #{len(steps) + 1}[/bold]")
-        selected = _ask_select("  Activity:", choices)
+        if use_autocomplete:
+            selected = _ask_autocomplete("  Activity (type to search):", choices)
+        else:
+            selected = _ask_select("  Activity:", choices)
         activity = choice_to_id[selected]
-        step_id_input = _ask("  Step ID (optional, press Enter to default to activity ID):").strip()
+        step_id_input = _ask(
+            "  Step ID (optional, press Enter to default to activity ID):",
+            validate=_slug_validate,
+        )
         cp_ref = _ask("  Control point ID to attach (optional, press Enter to skip):")
 
         step: dict[str, Any] = {"activity": activity}
         if step_id_input and step_id_input != activity:
-            step["id"] = _slug(step_id_input) or step_id_input
+            step["id"] = step_id_input
         if cp_ref:
             step["control_point"] = cp_ref
 
@@ -258,13 +443,14 @@ def _step_agents_and_save(
     registry_path: Path,
     skill_slug: str,
     business_area: str,
+    preview: bool = True,
 ) -> None:
     """Final step — authorised agents, YAML preview, save."""
-    console.rule("[bold cyan]Final Step — Authorised Agents & Save[/bold cyan]")
-    console.print(
+    _step_header(
+        _FINAL_STEP,
         "Enter the agent IDs authorised to load this skill.\n"
         "Use format [cyan]<function>-agent-<environment>[/cyan], e.g. loan-processor-agent-prod\n"
-        "Enter [yellow]*[/yellow] to allow all agents (not recommended)."
+        "Enter [yellow]*[/yellow] to allow all agents (not recommended).",
     )
     agents = _collect_list("Authorised agent IDs:", min_items=1)
     if "*" in agents:
@@ -272,43 +458,109 @@ def _step_agents_and_save(
 
     skill_data["metadata"]["authorised_agents"] = agents
 
-    # Preview
-    console.rule("[bold]YAML Preview[/bold]")
-    yaml_str = yaml.dump(skill_data, sort_keys=False, allow_unicode=True, default_flow_style=False)
-    console.print(Syntax(yaml_str, "yaml", theme="monokai", line_numbers=True))
+    _save_skill(skill_data, registry_path, skill_slug, business_area, preview=preview)
+
+
+def _validation_failure(exc: ValidationError, action: str) -> Group:
+    return Group(
+        Text.from_markup(f"[red]✗[/red] Schema validation failed — {action}:"),
+        *(Text.from_markup(f"  • {msg}") for msg in exc.errors),
+    )
+
+
+def _save_skill(
+    skill_data: dict[str, Any],
+    registry_path: Path,
+    skill_slug: str,
+    business_area: str,
+    preview: bool = True,
+    interactive: bool = True,
+    source: bytes | None = None,
+) -> None:
+    """Preview (optional), write and validate a skill.
+
+    When interactive is False no prompts are shown: the skill is validated
+    first and only saved if it passes, without confirmation, and an existing
+    skill.yml is never overwritten.
 
-    if not _ask_confirm("\nSave this skill?", default=True):
+    source, if given, is the YAML skill_data was parsed from; it is previewed
+    and written verbatim instead of re-dumping skill_data.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as _Dumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+
+    yaml_str = None
+    if preview:
+        from rich.syntax import Syntax
+
+        console.print(_rule("[bold]YAML Preview[/bold]"))
+        if source is None:
+            yaml_str = yaml.dump(skill_data, Dumper=_Dumper, **_YAML_DUMP_OPTS)
+            preview_str = yaml_str
+        else:
+            preview_str = source.decode("utf-8", errors="replace")
+        console.print(Syntax(preview_str, "yaml", theme="monokai", line_numbers=True))
+
+    if interactive and not _ask_confirm("\nSave this skill?", default=True):
         console.print("[yellow]Skill not saved.[/yellow]")
         return
 
     # Determine output path (directory-based: business_area/skill-name/skill.yml)
     skill_dir = registry_path / business_area / skill_slug
-    skill_dir.mkdir(parents=True, exist_ok=True)
     out_path = skill_dir / "skill.yml"
 
-    if out_path.exists():
+    # A prepared file is validated before anything is written; an invalid one is
+    # refused. validate_skill_data renders the in-memory dict, so out_path need not exist.
+    warnings = None
+    if not interactive:
+        try:
+            warnings = validate_skill_data(skill_data, out_path)
+        except ValidationError as exc:
+            err_console.print(_validation_failure(exc, "not saved"))
+            sys.exit(1)
+
+    if not os.path.isdir(skill_dir):
+        skill_dir.mkdir(parents=True, exist_ok=True)
+
+    # lstat only: also catches a dangling skill.yml symlink, which exists() misses
+    if os.path.lexists(out_path):
+        if not interactive:
+            err_console.print(f"[red]✗[/red] {out_path} already exists — not overwriting.")
+            sys.exit(1)
         if not _ask_confirm(f"File {out_path} already exists. Overwrite?", default=False):
             console.print("[yellow]Skill not saved.[/yellow]")
             return
 
-    out_path.write_text(yaml_str)
-    console.print(f"\n[green]✓[/green] Saved to [bold]{out_path}[/bold]")
-
-    # Validate immediately
-    from supervisory_procedures.core.validator import validate_skill, ValidationError
+    if source is not None:
+        out_path.write_bytes(source)
+    else:
+        with out_path.open("w", encoding="utf-8") as f:
+            if yaml_str is None:
+                yaml.dump(skill_data, f, Dumper=_Dumper, **_YAML_DUMP_OPTS)
+            else:
+                f.write(yaml_str)
+    # Buffer the report so each stream is rendered in one print
+    report: list[RenderableType] = [
+        Text.from_markup(f"\n[green]✓[/green] Saved to [bold]{out_path}[/bold]")
+    ]
+
+    # Validate immediately — the in-memory dict, so the file isn't re-parsed
     try:
-        warnings = validate_skill(out_path)
-        console.print("[green]✓[/green] Schema validation passed")
-        for w in warnings:
-            console.print(f"  [yellow]⚠[/yellow]  {w.message}")
+        if warnings is None:
+            warnings = validate_skill_data(skill_data, out_path)
+        report.append(Text.from_markup("[green]✓[/green] Schema validation passed"))
+        report.extend(Text.from_markup(f"  [yellow]⚠[/yellow]  {w.message}") for w in warnings)
     except ValidationError as exc:
-        err_console.print("[red]✗[/red] Schema validation failed — please review and fix:")
-        for msg in exc.errors:
-            err_console.print(f"  • {msg}")
+        console.print(Group(*report))
+        report = []
+        err_console.print(_validation_failure(exc, "please review and fix"))
 
     # Git instructions
-    console.print()
-    console.print(Panel(
+    console.print(Group(*report, Text(""), Panel(
         f"[bold]Next steps:[/bold]\n\n"
         f"  git add {skill_dir}\n"
         f"  git commit -m 'feat: add {skill_data['metadata']['id']} skill'\n"
@@ -316,7 +568,74 @@ def _step_agents_and_save(
         f"  # Then open a pull request for review",
         title="Git workflow",
         border_style="green",
-    ))
+    )))
+
+
+def _build_skill(
+    *,
+    skill_id: str,
+    name: str,
+    version: str,
+    business_area: str,
+    supervisor: dict[str, str],
+    context: dict[str, Any],
+    approved_activities: list[dict[str, str]],
+    constraints: dict[str, Any],
+    control_points: list[dict[str, Any]],
+    workflow: dict[str, Any],
+) -> dict[str, Any]:
+    """Assemble a draft skill dict from the wizard's answers (no I/O, no prompts)."""
+    return {
+        "metadata": {
+            "id": skill_id,
+            "name": name,
+            "version": version,
+            "schema_version": "2.1",
+            "business_area": business_area,
+            "supervisor": supervisor,
+            "status": "draft",
+        },
+        "context": context,
+        "approved_activities": approved_activities,
+        "constraints": constraints,
+        "control_points": control_points,
+        "workflow": workflow,
+    }
+
+
+def _load_prepared_skill(path: Path) -> tuple[dict[str, Any], bytes, str, str]:
+    """Load a prepared skill YAML for --from-file.
+
+    Returns (data, source, business_area, slug); source is the file's bytes,
+    which are saved as-is so the author's comments and layout survive.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as _Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+    # One read: the bytes that are validated are the bytes that get saved
+    source = path.read_bytes()
+    try:
+        skill_data = yaml.load(source, Loader=_Loader)
+    except yaml.YAMLError as exc:
+        err_console.print(f"[red]✗[/red] YAML parse error in {path}: {exc}")
+        sys.exit(1)
+    if not isinstance(skill_data, dict):
+        err_console.print(f"[red]✗[/red] {path}: top-level YAML must be a mapping")
+        sys.exit(1)
+
+    metadata = skill_data.get("metadata")
+    skill_id = metadata.get("id", "") if isinstance(metadata, dict) else ""
+    if not isinstance(skill_id, str) or not _SKILL_ID_RE.fullmatch(skill_id):
+        err_console.print(
+            f"[red]✗[/red] {path}: metadata.id must be of the form business_area/skill-name"
+        )
+        sys.exit(1)
+    business_area, skill_slug = skill_id.split("/", 1)
+    return skill_data, source, business_area, skill_slug
 
 
 # ---------------------------------------------------------------------------
@@ -330,14 +649,50 @@ def _step_agents_and_save(
     type=click.Path(file_okay=False),
     help="Override default registry path.",
 )
-def new(registry: str | None) -> None:
+@click.option(
+    "--no-preview",
+    is_flag=True,
+    default=False,
+    help="Skip the syntax-highlighted YAML preview before saving.",
+)
+@click.option(
+    "--from-file",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Save and validate a prepared skill YAML without prompting.",
+)
+def new(registry: str | None, no_preview: bool, from_file: str | None) -> None:
     """Launch the guided wizard to create a new Agent Skill YAML.
 
     Walks through 8 steps covering all required schema fields and writes
     a validated YAML file to the registry.
+
+    With --from-file, the prompts are skipped: the given YAML is written to
+    <registry>/<business_area>/<skill-name>/skill.yml (taken from metadata.id)
+    and validated. An existing skill.yml is never overwritten in this mode.
     """
+    import yaml
+
     registry_path = Path(registry) if registry else _DEFAULT_REGISTRY
 
+    if not yaml.__with_libyaml__:
+        console.print(
+            "[dim]PyYAML is running without libyaml — install libyaml for faster YAML output.[/dim]"
+        )
+
+    if from_file:
+        skill_data, source, business_area, skill_slug = _load_prepared_skill(Path(from_file))
+        _save_skill(
+            skill_data,
+            registry_path,
+            skill_slug,
+            business_area,
+            preview=not no_preview,
+            interactive=False,
+            source=source,
+        )
+        return
+
     console.print()
     console.print(Panel(
         "[bold]Supervisory Procedures — New Skill Wizard[/bold]\n\n"
@@ -356,21 +711,19 @@ def new(registry: str | None) -> None:
     control_points = _step_control_points()
     workflow = _step_workflow(approved_activities)
 
-    skill_data: dict[str, Any] = {
-        "metadata": {
-            "id": skill_id,
-            "name": name,
-            "version": version,
-            "schema_version": "2.1",
-            "business_area": business_area,
-            "supervisor": supervisor,
-            "status": "draft",
-        },
-        "context": context,
-        "approved_activities": approved_activities,
-        "constraints": constraints,
-        "control_points": control_points,
-        "workflow": workflow,
-    }
+    skill_data = _build_skill(
+        skill_id=skill_id,
+        name=name,
+        version=version,
+        business_area=business_area,
+        supervisor=supervisor,
+        context=context,
+        approved_activities=approved_activities,
+        constraints=constraints,
+        control_points=control_points,
+        workflow=workflow,
+    )
 
-    _step_agents_and_save(skill_data, registry_path, skill_slug, business_area)
+    _step_agents_and_save(
+        skill_data, registry_path, skill_slug, business_area, preview=not no_preview
+    )
@@ -7,6 +7,7 @@ Layer 3 — Schema validity gate: invalid skills excluded at registry load time.
 
 from __future__ import annotations
 
+from collections.abc import Collection, Mapping
 from typing import Any
 
 
@@ -39,27 +40,38 @@ class AgentNotAuthorisedError(PermissionError):
         )
 
 
-def check_access(skill_data: dict[str, Any], agent_id: str) -> None:
+def check_access(
+    skill_data: Mapping[str, Any],
+    agent_id: str,
+    authorised_agents: Collection[str] | None = None,
+) -> None:
     """Raise an appropriate error if agent_id is not permitted to use the skill.
 
     Enforces access-control layers:
     - Layer 1: skill must be approved
     - Layer 2: agent_id must be in authorised_agents
     - Layer 3: schema validity is enforced at registry load time
+
+    Callers that check the same skill repeatedly (e.g. the registry) can pass
+    a precomputed frozenset of ``metadata.authorised_agents`` to get O(1)
+    allowlist lookups instead of scanning the list.
     """
     meta = skill_data.get("metadata", {})
     skill_id: str = meta.get("id", "<unknown>")
     status: str = meta.get("status", "draft")
-    authorised_agents: list[str] = meta.get("authorised_agents", [])
+    if authorised_agents is None:
+        authorised_agents = meta.get("authorised_agents", [])
 
     if status != "approved":
         raise SkillNotApprovedError(skill_id, status)
 
-    if _WILDCARD not in authorised_agents and agent_id not in authorised_agents:
+    # Named agent first: the common authorised case is then a single lookup,
+    # and the wildcard is only probed for agents not on the list
+    if agent_id not in authorised_agents and _WILDCARD not in authorised_agents:
         raise AgentNotAuthorisedError(agent_id, skill_id)
 
 
-def is_permitted(skill_data: dict[str, Any], agent_id: str) -> bool:
+def is_permitted(skill_data: Mapping[str, Any], agent_id: str) -> bool:
     """Return True if the agent is permitted; False otherwise (no exception)."""
     try:
         check_access(skill_data, agent_id)
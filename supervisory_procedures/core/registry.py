@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
+import sys
+from collections.abc import Iterable, Mapping
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from .access_control import (
@@ -12,13 +17,24 @@ from .access_control import (
     SkillNotFoundError,
     check_access,
 )
-from .validator import ValidationError, load_yaml, validate_skill
+from .validator import ValidationError, load_yaml, validate_skill_data
 
 logger = logging.getLogger(__name__)
 
 # Default registry location relative to the project root
 _DEFAULT_REGISTRY = Path(__file__).parent.parent.parent / "registry"
 
+_by_id = itemgetter("id")
+
+# Enum-like fields whose values repeat across every skill
+_INTERNED_FIELDS = frozenset({"classification", "activation", "status", "risk_classification"})
+
+# Directories never worth descending into when scanning for skills
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules"})
+
+# (skill_id, skill data, list_skills summary, authorised agent set)
+_ParsedSkill = tuple[str, Mapping[str, Any], Mapping[str, Any], frozenset[str]]
+
 
 class SkillRegistry:
     """Load and serve skills from the Git registry directory.
@@ -36,7 +52,18 @@ class SkillRegistry:
 
     def __init__(self, registry_path: Path | str | None = None) -> None:
         self._registry_path = Path(registry_path) if registry_path else _DEFAULT_REGISTRY
-        self._cache: dict[str, dict[str, Any]] = {}
+        self._cache: dict[str, Mapping[str, Any]] = {}
+        # Per-file invalidation state: mtime at last parse and the parse result
+        # (None for files that failed validation), so reloads only re-parse edits.
+        self._mtimes: dict[Path, int] = {}
+        self._parsed: dict[Path, _ParsedSkill | None] = {}
+        # list_skills summary dicts, built once per parse rather than per call
+        self._summaries: dict[str, Mapping[str, Any]] = {}
+        # Hashed authorised_agents per skill for O(1) allowlist checks
+        self._agent_sets: dict[str, frozenset[str]] = {}
+        # Secondary indexes for list_skills filters: value -> skill ids
+        self._by_business_area: dict[str, list[str]] = {}
+        self._by_status: dict[str, list[str]] = {}
         self._loaded = False
 
     # ------------------------------------------------------------------
@@ -49,38 +76,85 @@ class SkillRegistry:
         Only directory-based skills (skill.yml inside a named directory) are
         loaded. Invalid skill files are skipped with a warning; they do not
         prevent other skills from loading.
+
+        With force_reload, only files whose mtime changed since the last load
+        are re-parsed; deleted files are dropped from the cache.
         """
         if self._loaded and not force_reload:
             return
 
-        self._cache.clear()
+        mtimes = {
+            path: path.stat().st_mtime_ns
+            for path in _find_skill_files(self._registry_path)
+        }
+        stale = [path for path, mtime in mtimes.items() if self._mtimes.get(path) != mtime]
+
+        results = [self._parse_skill_file(path) for path in stale]
 
-        for path in sorted(self._registry_path.rglob("skill.yml")):
-            self._load_skill_file(path)
+        for path in self._mtimes.keys() - mtimes.keys():
+            del self._parsed[path]
+        self._parsed.update(zip(stale, results))
+        self._mtimes = mtimes
+
+        # Rebuild in path order so duplicate ids resolve as on a full load
+        self._cache.clear()
+        self._summaries.clear()
+        self._agent_sets.clear()
+        for path in mtimes:
+            result = self._parsed[path]
+            if result is not None:
+                skill_id, data, summary, agents = result
+                self._cache[skill_id] = data
+                self._summaries[skill_id] = summary
+                self._agent_sets[skill_id] = agents
+
+        self._by_business_area.clear()
+        self._by_status.clear()
+        for skill_id, data in self._cache.items():
+            meta = data.get("metadata", {})
+            self._by_business_area.setdefault(meta.get("business_area"), []).append(skill_id)
+            self._by_status.setdefault(meta.get("status"), []).append(skill_id)
+
+        if stale and logger.isEnabledFor(logging.DEBUG):
+            # One line per load rather than one call per file
+            logger.debug(
+                "Parsed skills: %s",
+                ", ".join(f"{r[0]} ({p})" for p, r in zip(stale, results) if r is not None),
+            )
 
         self._loaded = True
         logger.info("Registry loaded: %d valid skills", len(self._cache))
 
-    def _load_skill_file(self, path: Path) -> None:
-        """Validate and load a single skill file into the cache."""
+    def _parse_skill_file(self, path: Path) -> _ParsedSkill | None:
+        """Validate and parse a single skill file; return a _ParsedSkill or None if invalid."""
         try:
-            validate_skill(path)
+            # One read: the parsed dict is validated in place, not re-read from disk
             data = load_yaml(path)
+            validate_skill_data(data, path)
             skill_id: str = data["metadata"]["id"]
             data["_skill_dir"] = str(path.parent)
-            self._cache[skill_id] = data
-            logger.debug("Loaded skill %s from %s", skill_id, path)
+            frozen = _freeze(data)
+            summary = MappingProxyType({
+                **frozen["metadata"],
+                "risk_classification": frozen.get("context", {}).get("risk_classification", ""),
+            })
+            agents = frozenset(frozen["metadata"].get("authorised_agents", ()))
+            return skill_id, frozen, summary, agents
         except ValidationError as exc:
             logger.warning("Skipping invalid skill %s: %s", path, exc)
         except (KeyError, ValueError) as exc:
             logger.warning("Skipping malformed skill %s: %s", path, exc)
+        return None
 
     def get_skill(
         self,
         skill_id: str,
         agent_id: str | None = None,
-    ) -> dict[str, Any]:
-        """Return the skill data dict for skill_id.
+    ) -> Mapping[str, Any]:
+        """Return the skill data for skill_id.
+
+        The returned mapping is the cached, read-only copy: nested mappings are
+        MappingProxyType and lists are tuples. Use thaw() for a mutable copy.
 
         If agent_id is provided, all three access-control layers are enforced:
         - Layer 1: skill must be approved
@@ -92,17 +166,17 @@ class SkillRegistry:
             SkillNotApprovedError: if the skill is draft/deprecated
             AgentNotAuthorisedError: if the agent is not on the allowlist
         """
-        self.load()
+        if not self._loaded:
+            self.load()
 
-        if skill_id not in self._cache:
+        skill_data = self._cache.get(skill_id)
+        if skill_data is None:
             raise SkillNotFoundError(
                 f"Skill '{skill_id}' not found in registry at {self._registry_path}"
             )
 
-        skill_data = self._cache[skill_id]
-
         if agent_id is not None:
-            check_access(skill_data, agent_id)
+            check_access(skill_data, agent_id, self._agent_sets[skill_id])
 
         return skill_data
 
@@ -110,41 +184,85 @@ class SkillRegistry:
         self,
         business_area: str | None = None,
         status: str | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> list[Mapping[str, Any]]:
         """Return summary dicts for all (filtered) skills in the registry.
 
         Each summary dict merges the top-level ``metadata`` block with a
         ``risk_classification`` key pulled from the ``context`` block, so
-        callers don't need to know the internal structure.
+        callers don't need to know the internal structure. Summaries are
+        built at load time, shared between calls, and read-only.
 
         Args:
             business_area: if set, only return skills in this business area slug
             status: if set, only return skills with this status
         """
-        self.load()
-
-        results = []
-        for skill_data in self._cache.values():
-            meta = skill_data.get("metadata", {})
-            if business_area and meta.get("business_area") != business_area:
-                continue
-            if status and meta.get("status") != status:
-                continue
-            summary = dict(meta)
-            summary["risk_classification"] = skill_data.get("context", {}).get(
-                "risk_classification", ""
-            )
-            results.append(summary)
-
-        return sorted(results, key=lambda m: m.get("id", ""))
+        if not self._loaded:
+            self.load()
+
+        skill_ids: Iterable[str]
+        if business_area and status:
+            wanted = set(self._by_status.get(status, ()))
+            skill_ids = [s for s in self._by_business_area.get(business_area, ()) if s in wanted]
+        elif business_area:
+            skill_ids = self._by_business_area.get(business_area, [])
+        elif status:
+            skill_ids = self._by_status.get(status, [])
+        else:
+            skill_ids = self._cache
+
+        summaries = self._summaries
+        results = [summaries[skill_id] for skill_id in skill_ids]
+        # Every cached skill has metadata.id — _parse_skill_file rejects files without one
+        results.sort(key=_by_id)
+        return results
 
     def __len__(self) -> int:
-        self.load()
+        if not self._loaded:
+            self.load()
         return len(self._cache)
 
     def __contains__(self, skill_id: str) -> bool:
-        self.load()
+        if not self._loaded:
+            self.load()
         return skill_id in self._cache
 
 
-__all__ = ["SkillRegistry"]
+def _freeze(obj: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples.
+
+    String keys, and the values of the small fixed-vocabulary fields, are
+    interned so every cached skill shares one copy of each.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({
+            (sys.intern(k) if type(k) is str else k): (
+                sys.intern(v) if k in _INTERNED_FIELDS and type(v) is str else _freeze(v)
+            )
+            for k, v in obj.items()
+        })
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Return a plain, mutable dict/list copy of a frozen registry skill (for dumping/editing)."""
+    if isinstance(obj, Mapping):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+def _find_skill_files(root: Path) -> list[Path]:
+    """Return every skill.yml under root, sorted, skipping dot-dirs and build noise."""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d[0] != "." and d not in _SKIP_DIRS]
+        if "skill.yml" in filenames:
+            paths.append(Path(dirpath, "skill.yml"))
+    paths.sort()
+    return paths
+
+
+__all__ = ["SkillRegistry", "thaw"]
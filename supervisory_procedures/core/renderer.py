@@ -2,117 +2,171 @@
 
 from __future__ import annotations
 
-import re
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 _SHARED = "registry/shared"
 _MAX_DESCRIPTION = 1024
 
+# Shared, immutable defaults for missing blocks — no fresh {} / [] per lookup
+_EMPTY: Any = MappingProxyType({})
+_EMPTY_LIST: Any = ()
+
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def render_skill_md(skill_data: dict[str, Any]) -> str:
+def render_skill_md(skill_data: Mapping[str, Any]) -> str:
     """Generate a complete SKILL.md string from a validated skill data dict."""
-    sections = [
-        _frontmatter(skill_data),
-        _header(skill_data),
-        _initialisation(skill_data),
-        _approved_activities(skill_data),
-        _unacceptable_actions(skill_data),
-        _vetoed_conditions(skill_data),
-        _oversight_checkpoints(skill_data),
-        _condition_triggered_controls(skill_data),
-        _workflow(skill_data),
-    ]
-    return "\n".join(s for s in sections if s).rstrip() + "\n"
+    # Every section appends newline-terminated lines to one shared buffer;
+    # an empty section simply appends nothing.
+    buf: list[str] = []
+    vetoed, step_cps, conditional_cps = _partition_control_points(skill_data)
+    _frontmatter(buf, skill_data)
+    _header(buf, skill_data)
+    _initialisation(buf, skill_data)
+    _approved_activities(buf, skill_data)
+    _unacceptable_actions(buf, skill_data)
+    _vetoed_conditions(buf, skill_data, vetoed)
+    _oversight_checkpoints(buf, skill_data, step_cps)
+    _condition_triggered_controls(buf, skill_data, conditional_cps)
+    _workflow(buf, skill_data)
+    return "".join(buf).rstrip() + "\n"
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _skill_id(skill_data: dict[str, Any]) -> str:
-    return skill_data.get("metadata", {}).get("id", "unknown")
+def _skill_id(skill_data: Mapping[str, Any]) -> str:
+    return skill_data.get("metadata", _EMPTY).get("id", "unknown")
 
 
-def _skill_yml_path(skill_data: dict[str, Any]) -> str:
+def _skill_yml_path(skill_data: Mapping[str, Any]) -> str:
     return f"registry/{_skill_id(skill_data)}/skill.yml"
 
 
-def _cp_index(skill_data: dict[str, Any]) -> dict[str, dict[str, Any]]:
-    return {cp["id"]: cp for cp in skill_data.get("control_points", [])}
+def _cp_index(skill_data: Mapping[str, Any]) -> dict[str, Mapping[str, Any]]:
+    return {cp["id"]: cp for cp in skill_data.get("control_points", _EMPTY_LIST)}
+
+
+_ControlPoints = list[Mapping[str, Any]]
+
+
+def _partition_control_points(
+    skill_data: Mapping[str, Any],
+) -> tuple[_ControlPoints, _ControlPoints, _ControlPoints]:
+    """Split control points into (vetoed, step-activated, conditional) in one pass.
+
+    auto control points, and non-vetoed ones with any other activation, are
+    rendered only via the workflow and belong to no bucket.
+    """
+    vetoed: _ControlPoints = []
+    step: _ControlPoints = []
+    conditional: _ControlPoints = []
+    for cp in skill_data.get("control_points", _EMPTY_LIST):
+        classification = cp.get("classification")
+        if classification == "vetoed":
+            vetoed.append(cp)
+        elif classification != "auto":
+            activation = cp.get("activation")
+            if activation == "step":
+                step.append(cp)
+            elif activation == "conditional":
+                conditional.append(cp)
+    return vetoed, step, conditional
 
 
 def _inline(text: str) -> str:
     """Collapse multi-line YAML strings to a single line."""
+    # split/join beats re.sub(r"\s+", " ", ...).strip() several-fold here and
+    # splits on exactly the same (Unicode) whitespace
     return " ".join(text.split())
 
 
-def _cp_display_name(cp: dict[str, Any]) -> str:
+def _cp_display_name(cp: Mapping[str, Any]) -> str:
     """Return display name for a control point: explicit name or title-cased id."""
     if cp.get("name"):
         return cp["name"]
-    return re.sub(r"-", " ", cp["id"]).title()
+    return cp["id"].replace("-", " ").title()
 
 
-def _checkpoint_gate_cmd(skill_id: str, cp: dict[str, Any]) -> str:
+def _checkpoint_gate_cmd(skill_id: str, cp: Mapping[str, Any]) -> str:
     """Build a checkpoint_gate.py bash invocation from a control point dict."""
+    get = cp.get
     args = [
         f"python {_SHARED}/checkpoint-gate/scripts/checkpoint_gate.py",
         f"  --skill {skill_id}",
         "  --session ${CLAUDE_SESSION_ID}",
         f"  --control-point {cp['id']}",
-        f"  --classification {cp.get('classification', '')}",
+        f"  --classification {get('classification', '')}",
     ]
-    if cp.get("who_reviews"):
-        args.append(f'  --reviewer "{cp["who_reviews"]}"')
-    if cp.get("sla_hours"):
-        args.append(f"  --sla-hours {cp['sla_hours']}")
-    if cp.get("escalation_contact"):
-        args.append(f"  --contact {cp['escalation_contact']}")
+    who_reviews = get("who_reviews")
+    if who_reviews:
+        args.append(f'  --reviewer "{who_reviews}"')
+    sla_hours = get("sla_hours")
+    if sla_hours:
+        args.append(f"  --sla-hours {sla_hours}")
+    contact = get("escalation_contact")
+    if contact:
+        args.append(f"  --contact {contact}")
     return " \\\n".join(args)
 
 
-def _audit_log_cmd(skill_id: str, action: str) -> str:
+def _audit_log_prefix(skill_id: str) -> str:
+    """audit_log.py invocation up to (not including) the --action value."""
     return (
         f"python {_SHARED}/audit-logging/scripts/audit_log.py \\\n"
         f"  --skill {skill_id} \\\n"
         f"  --session ${{CLAUDE_SESSION_ID}} \\\n"
-        f"  --action {action}"
+        f"  --action "
     )
 
 
-def _validate_activity_cmd(skill_yml_path: str, step_id: str) -> str:
+def _audit_log_cmd(skill_id: str, action: str) -> str:
+    return _audit_log_prefix(skill_id) + action
+
+
+def _validate_activity_prefix(skill_yml_path: str) -> str:
+    """validate_activity.py invocation up to (not including) the --step value."""
     return (
         f"python {_SHARED}/validate-activity/scripts/validate_activity.py \\\n"
         f"  --skill {skill_yml_path} \\\n"
-        f"  --step {step_id}"
+        f"  --step "
     )
 
 
-def _halt_comment(classification: str) -> str:
-    return {
-        "vetoed": "# Exit code 2 — halt all processing immediately.",
-        "needs_approval": "# PENDING — halt here and await explicit approval before continuing.",
-        "review": "# PENDING — halt here and await reviewer clearance before continuing.",
-        "notify": "# NOTIFY — human is informed; agent may continue.",
-    }.get(classification, "")
+_HALT_COMMENTS: dict[str, str] = {
+    "vetoed": "# Exit code 2 — halt all processing immediately.",
+    "needs_approval": "# PENDING — halt here and await explicit approval before continuing.",
+    "review": "# PENDING — halt here and await reviewer clearance before continuing.",
+    "notify": "# NOTIFY — human is informed; agent may continue.",
+}
+
+# Workflow label for a step's attached control point, by classification
+_CP_LABELS: dict[str, str] = {
+    "auto": "auto — agent proceeds automatically",
+    "needs_approval": "halt and await approval",
+    "review": "halt and await review",
+    "notify": "notify and continue",
+}
 
 
-def _effective_step_id(step: dict[str, Any]) -> str:
-    """Return the effective step ID — explicit id if present, else the activity id."""
-    return step.get("id") or step.get("activity", "?")
+def _halt_comment(classification: str) -> str:
+    return _HALT_COMMENTS.get(classification, "")
 
 
 # ---------------------------------------------------------------------------
 # Section renderers
 # ---------------------------------------------------------------------------
+# Each renderer appends its lines, newline-terminated, to buf. A section ends
+# with a blank line (or a "---" rule line) so sections are separated by one.
 
-def _frontmatter(skill_data: dict[str, Any]) -> str:
-    meta = skill_data.get("metadata", {})
-    ctx = skill_data.get("context", {})
+def _frontmatter(buf: list[str], skill_data: Mapping[str, Any]) -> None:
+    meta = skill_data.get("metadata", _EMPTY)
+    ctx = skill_data.get("context", _EMPTY)
 
     name = meta.get("id", "").split("/")[-1]
 
@@ -120,7 +174,7 @@ def _frontmatter(skill_data: dict[str, Any]) -> str:
     area = meta.get("business_area", "").replace("_", " ")
     skill_name = meta.get("name", "")
     risk = ctx.get("risk_classification", "")
-    agents = ", ".join(meta.get("authorised_agents", []))
+    agents = ", ".join(meta.get("authorised_agents", _EMPTY_LIST))
 
     use_when = f"Use when {skill_name} is needed for {area} operations."
     suffix = f" {use_when} Risk: {risk}. Authorised agents: {agents}."
@@ -128,159 +182,135 @@ def _frontmatter(skill_data: dict[str, Any]) -> str:
     if len(raw_desc) + len(suffix) > _MAX_DESCRIPTION:
         raw_desc = raw_desc[: _MAX_DESCRIPTION - len(suffix) - 3] + "..."
 
-    description = raw_desc + suffix
-    return f'---\nname: {name}\ndescription: "{description}"\n---\n'
+    buf.append(f'---\nname: {name}\ndescription: "{raw_desc}{suffix}"\n---\n\n')
 
 
-def _header(skill_data: dict[str, Any]) -> str:
-    meta = skill_data.get("metadata", {})
-    ctx = skill_data.get("context", {})
-    sup = meta.get("supervisor", {})
+def _header(buf: list[str], skill_data: Mapping[str, Any]) -> None:
+    meta = skill_data.get("metadata", _EMPTY)
+    ctx = skill_data.get("context", _EMPTY)
+    sup = meta.get("supervisor", _EMPTY)
 
-    regs = ctx.get("applicable_regulations", [])
+    regs = ctx.get("applicable_regulations", _EMPTY_LIST)
     reg_str = " | ".join(regs) if regs else "None specified"
 
-    return (
+    buf.append(
         f"# {meta.get('name', '')}\n\n"
         f"> **Governed Skill** — Supervisor: {sup.get('name', '')} ({sup.get('role', '')})\n"
         f"> Risk: **{ctx.get('risk_classification', '')}** | "
         f"Version: {meta.get('version', '')} | "
         f"Regulations: {reg_str}\n\n"
         "*All steps, controls, and restrictions below are defined by your supervisor. "
-        "Follow this procedure exactly.*\n\n---"
+        "Follow this procedure exactly.*\n\n---\n"
     )
 
 
-def _initialisation(skill_data: dict[str, Any]) -> str:
+def _initialisation(buf: list[str], skill_data: Mapping[str, Any]) -> None:
     sid = _skill_id(skill_data)
-    return (
+    buf.append(
         "## Initialisation\n\n"
         "Before any other action, record that this skill has been invoked:\n\n"
-        f"```bash\n{_audit_log_cmd(sid, 'skill_invoked')}\n```\n\n---"
+        f"```bash\n{_audit_log_cmd(sid, 'skill_invoked')}\n```\n\n---\n"
     )
 
 
-def _approved_activities(skill_data: dict[str, Any]) -> str:
+def _approved_activities(buf: list[str], skill_data: Mapping[str, Any]) -> None:
     syml = _skill_yml_path(skill_data)
-    activities = skill_data.get("approved_activities", [])
-
-    validate_cmd = (
-        f"python {_SHARED}/validate-activity/scripts/validate_activity.py \\\n"
-        f"  --skill {syml} \\\n"
-        f"  --step <step-id>"
-    )
-
-    rows = "\n".join(
-        f"| `{act['id']}` | {act['description']} |" for act in activities
-    )
+    activities = skill_data.get("approved_activities", _EMPTY_LIST)
 
-    return (
+    buf.append(
         "## Approved Activities\n\n"
         "You may **only** perform activities listed below. "
         "Validate each step before executing:\n\n"
-        f"```bash\n{validate_cmd}\n```\n\n"
+        f"```bash\n{_validate_activity_prefix(syml)}<step-id>\n```\n\n"
         "If `\"allowed\": false` — halt immediately and log the attempt.\n\n"
         "| Activity ID | Description |\n"
         "|-------------|-------------|\n"
-        f"{rows}\n\n---"
     )
+    buf.append("\n".join(f"| `{act['id']}` | {act['description']} |" for act in activities))
+    buf.append("\n\n---\n")
 
 
-def _unacceptable_actions(skill_data: dict[str, Any]) -> str:
-    actions = skill_data.get("constraints", {}).get("unacceptable_actions", [])
+def _unacceptable_actions(buf: list[str], skill_data: Mapping[str, Any]) -> None:
+    actions = skill_data.get("constraints", _EMPTY).get("unacceptable_actions", _EMPTY_LIST)
     if not actions:
-        return ""
-    items = "\n".join(f"- {a}" for a in actions)
-    return f"## What You Must Never Do\n\n{items}\n\n---"
+        return
+    buf.append("## What You Must Never Do\n\n")
+    for a in actions:
+        buf.append(f"- {a}\n")
+    buf.append("\n---\n")
+
 
+def _bash_block(buf: list[str], cmd: str, comment: str = "") -> None:
+    """Append a fenced bash block holding cmd and, if given, a trailing comment line."""
+    buf.append(f"```bash\n{cmd}\n{comment}\n```\n" if comment else f"```bash\n{cmd}\n```\n")
 
-def _vetoed_conditions(skill_data: dict[str, Any]) -> str:
+
+def _vetoed_conditions(
+    buf: list[str], skill_data: Mapping[str, Any], vetoed: _ControlPoints
+) -> None:
     sid = _skill_id(skill_data)
-    vetoed = [cp for cp in skill_data.get("control_points", []) if cp.get("classification") == "vetoed"]
     if not vetoed:
-        return ""
+        return
 
-    lines = [
-        "## Vetoed Conditions — Halt Immediately",
-        "",
+    buf.append(
+        "## Vetoed Conditions — Halt Immediately\n\n"
         "If any of these conditions arise, invoke the checkpoint immediately and halt. "
-        "No human override is possible.",
-        "",
-    ]
+        "No human override is possible.\n\n"
+    )
 
     for cp in vetoed:
-        cmd = _checkpoint_gate_cmd(sid, cp)
-        lines += [f"### {cp['id']} — {_cp_display_name(cp)}", "", _inline(cp.get("description", ""))]
+        buf.append(f"### {cp['id']} — {_cp_display_name(cp)}\n\n{_inline(cp.get('description', ''))}\n")
         if cp.get("trigger"):
-            lines += ["", f"**Trigger:** {_inline(cp['trigger'])}"]
-        lines += ["", f"```bash\n{cmd}\n{_halt_comment('vetoed')}\n```", ""]
+            buf.append(f"\n**Trigger:** {_inline(cp['trigger'])}\n")
+        buf.append("\n")
+        _bash_block(buf, _checkpoint_gate_cmd(sid, cp), _halt_comment("vetoed"))
+        buf.append("\n")
 
-    lines.append("---")
-    return "\n".join(lines)
+    buf.append("---\n")
 
 
-def _oversight_checkpoints(skill_data: dict[str, Any]) -> str:
+def _oversight_checkpoints(
+    buf: list[str], skill_data: Mapping[str, Any], checkpoints: _ControlPoints
+) -> None:
     """Control points with activation: step (referenced from workflow steps)."""
-    sid = _skill_id(skill_data)
-    checkpoints = [
-        cp for cp in skill_data.get("control_points", [])
-        if cp.get("classification") not in ("vetoed", "auto")
-        and cp.get("activation") == "step"
-    ]
-    if not checkpoints:
-        return ""
-
-    lines = [
-        "## Oversight Checkpoints",
-        "",
-        "These checkpoints are invoked at specific workflow steps (see Workflow section).",
-        "",
-    ]
-
-    for cp in checkpoints:
-        classification = cp.get("classification", "")
-        meta_parts = [f"Classification: **{classification}**"]
-        if cp.get("who_reviews"):
-            meta_parts.append(f"Reviewer: {cp['who_reviews']}")
-        if cp.get("sla_hours"):
-            meta_parts.append(f"SLA: {cp['sla_hours']}h")
-
-        cmd = _checkpoint_gate_cmd(sid, cp)
-        comment = _halt_comment(classification)
-        bash = f"```bash\n{cmd}\n{comment}\n```" if comment else f"```bash\n{cmd}\n```"
+    _checkpoint_section(
+        buf,
+        _skill_id(skill_data),
+        checkpoints,
+        title="Oversight Checkpoints",
+        intro="These checkpoints are invoked at specific workflow steps (see Workflow section).",
+        include_trigger=False,
+    )
 
-        lines += [
-            f"### {cp['id']} — {_cp_display_name(cp)}",
-            "",
-            " | ".join(meta_parts),
-            "",
-            _inline(cp.get("description", "")),
-            "",
-            bash,
-            "",
-        ]
 
-    lines.append("---")
-    return "\n".join(lines)
+def _condition_triggered_controls(
+    buf: list[str], skill_data: Mapping[str, Any], checkpoints: _ControlPoints
+) -> None:
+    """Control points with activation: conditional."""
+    _checkpoint_section(
+        buf,
+        _skill_id(skill_data),
+        checkpoints,
+        title="Condition-Triggered Controls",
+        intro="These activate when their trigger condition is met during any workflow step.",
+        include_trigger=True,
+    )
 
 
-def _condition_triggered_controls(skill_data: dict[str, Any]) -> str:
-    """Control points with activation: conditional."""
-    sid = _skill_id(skill_data)
-    checkpoints = [
-        cp for cp in skill_data.get("control_points", [])
-        if cp.get("classification") not in ("vetoed", "auto")
-        and cp.get("activation") == "conditional"
-    ]
+def _checkpoint_section(
+    buf: list[str],
+    sid: str,
+    checkpoints: _ControlPoints,
+    *,
+    title: str,
+    intro: str,
+    include_trigger: bool,
+) -> None:
+    """Shared body of the oversight and condition-triggered sections."""
     if not checkpoints:
-        return ""
+        return
 
-    lines = [
-        "## Condition-Triggered Controls",
-        "",
-        "These activate when their trigger condition is met during any workflow step.",
-        "",
-    ]
+    buf.append(f"## {title}\n\n{intro}\n\n")
 
     for cp in checkpoints:
         classification = cp.get("classification", "")
@@ -290,80 +320,56 @@ def _condition_triggered_controls(skill_data: dict[str, Any]) -> str:
         if cp.get("sla_hours"):
             meta_parts.append(f"SLA: {cp['sla_hours']}h")
 
-        cmd = _checkpoint_gate_cmd(sid, cp)
-        comment = _halt_comment(classification)
-        bash = f"```bash\n{cmd}\n{comment}\n```" if comment else f"```bash\n{cmd}\n```"
+        buf.append(f"### {cp['id']} — {_cp_display_name(cp)}\n\n{' | '.join(meta_parts)}\n\n")
+        if include_trigger:
+            buf.append(f"**Trigger:** {_inline(cp['trigger'])}\n\n")
+        buf.append(f"{_inline(cp.get('description', ''))}\n\n")
+        _bash_block(buf, _checkpoint_gate_cmd(sid, cp), _halt_comment(classification))
+        buf.append("\n")
 
-        lines += [
-            f"### {cp['id']} — {_cp_display_name(cp)}",
-            "",
-            " | ".join(meta_parts),
-            "",
-            f"**Trigger:** {_inline(cp['trigger'])}",
-            "",
-            _inline(cp.get("description", "")),
-            "",
-            bash,
-            "",
-        ]
+    buf.append("---\n")
 
-    lines.append("---")
-    return "\n".join(lines)
 
+def _workflow(buf: list[str], skill_data: Mapping[str, Any]) -> None:
+    steps = skill_data.get("workflow", _EMPTY).get("steps", _EMPTY_LIST)
+    if not steps:
+        return
 
-def _workflow(skill_data: dict[str, Any]) -> str:
     sid = _skill_id(skill_data)
-    syml = _skill_yml_path(skill_data)
-    steps = skill_data.get("workflow", {}).get("steps", [])
     cp_idx = _cp_index(skill_data)
     activity_map = {
         a["id"]: a["description"]
-        for a in skill_data.get("approved_activities", [])
+        for a in skill_data.get("approved_activities", _EMPTY_LIST)
     }
+    # Only the step id varies between steps' commands
+    validate_prefix = _validate_activity_prefix(_skill_yml_path(skill_data))
+    audit_prefix = _audit_log_prefix(sid)
 
-    if not steps:
-        return ""
-
-    lines = [
-        "## Workflow",
-        "",
-        "Execute steps in this exact order. Do not skip, reorder, or add steps.",
-        "",
-    ]
+    buf.append(
+        "## Workflow\n\n"
+        "Execute steps in this exact order. Do not skip, reorder, or add steps.\n\n"
+    )
 
     for i, step in enumerate(steps, 1):
-        step_id = _effective_step_id(step)
-        activity_id = step.get("activity", "")
+        get = step.get
+        step_id = get("id") or get("activity", "?")  # explicit id, else the activity id
+        activity_id = get("activity", "")
         activity = activity_map.get(activity_id, activity_id)
-        cp_ref = step.get("control_point")
+        cp_ref = get("control_point")
         cp = cp_idx.get(cp_ref) if cp_ref else None
 
-        validate_cmd = _validate_activity_cmd(syml, step_id)
-        audit_cmd = _audit_log_cmd(sid, step_id)
-
-        lines += [
-            f"### Step {i} — {step_id}",
-            "",
-            f"**Activity:** {activity}",  # resolved description
-            "",
-            f"```bash\n{validate_cmd}\n\n{audit_cmd}\n```",
-        ]
+        buf.append(
+            f"### Step {i} — {step_id}\n\n"
+            f"**Activity:** {activity}\n\n"  # resolved description
+            f"```bash\n{validate_prefix}{step_id}\n\n{audit_prefix}{step_id}\n```\n"
+        )
 
         if cp:
             classification = cp.get("classification", "")
-            cmd = _checkpoint_gate_cmd(sid, cp)
-            comment = _halt_comment(classification)
-            bash = f"```bash\n{cmd}\n{comment}\n```" if comment else f"```bash\n{cmd}\n```"
-
-            label = {
-                "auto": "auto — agent proceeds automatically",
-                "needs_approval": "halt and await approval",
-                "review": "halt and await review",
-                "notify": "notify and continue",
-            }.get(classification, classification)
+            label = _CP_LABELS.get(classification, classification)
 
-            lines += ["", f"Control point **{cp_ref}** ({label}):", "", bash]
+            buf.append(f"\nControl point **{cp_ref}** ({label}):\n\n")
+            _bash_block(buf, _checkpoint_gate_cmd(sid, cp), _halt_comment(classification))
 
-        lines.append("")
+        buf.append("\n")
 
-    return "\n".join(lines)
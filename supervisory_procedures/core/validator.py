@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 import functools
+import hashlib
 import json
+import logging
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
@@ -11,11 +18,29 @@ import yaml
 import jsonschema
 from jsonschema import Draft202012Validator, FormatChecker
 
+logger = logging.getLogger(__name__)
+
+_PURE_PYTHON_YAML = False
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+    _PURE_PYTHON_YAML = True
+
 # Path to the bundled schema — resolved relative to this file
 _SCHEMA_PATH = Path(__file__).parent.parent.parent / "schema" / "skill.schema.json"
 
 _WILDCARD_AGENT = "*"
 
+# SKILL.md renders keyed by a digest of the skill.yml bytes they were rendered
+# from, so repeated freshness checks on unchanged content skip the render. Only
+# filled where the dict was parsed from those same bytes (validate_skill,
+# validate_and_render); caller-supplied dicts are always rendered directly.
+# Bounded FIFO: the oldest entry is dropped once the cap is reached.
+_RENDER_CACHE_SIZE = 512
+_rendered: dict[bytes, str] = {}
+
 
 class ValidationError(Exception):
     """Raised when a skill file fails schema validation."""
@@ -27,12 +52,17 @@ class ValidationError(Exception):
         super().__init__(f"{path}: {summary}")
 
 
+@dataclass(slots=True, eq=False)
 class ValidationWarning:
-    """Non-fatal validation warning (e.g. wildcard agent)."""
+    """Non-fatal validation warning (e.g. wildcard agent).
 
-    def __init__(self, path: Path, message: str) -> None:
-        self.path = path
-        self.message = message
+    code is a stable identifier for the kind of warning (e.g. "wildcard_agents"),
+    for callers that filter warnings without matching on message text.
+    """
+
+    path: Path
+    message: str
+    code: str = ""
 
     def __str__(self) -> str:
         return f"WARNING {self.path}: {self.message}"
@@ -44,16 +74,42 @@ def _load_schema() -> dict[str, Any]:
         return json.load(f)
 
 
+@functools.cache
+def _get_validator() -> Draft202012Validator:
+    """Build the schema validator once per process.
+
+    The validator holds no per-validation state, so sharing it across calls
+    is safe.
+    """
+    return Draft202012Validator(_load_schema(), format_checker=FormatChecker())
+
+
 def load_yaml(path: Path) -> dict[str, Any]:
     """Load a YAML skill file and return as a dict. Raises ValueError on parse errors."""
+    return _read_skill(path)[0]
+
+
+def _read_skill(path: Path) -> tuple[dict[str, Any], bytes]:
+    """Load a YAML skill file; return (data, digest of the bytes it was parsed from)."""
+    if _PURE_PYTHON_YAML:
+        _log_pure_python_loader()
+    raw = path.read_bytes()
     try:
-        with path.open() as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(raw, Loader=_YamlLoader)
     except yaml.YAMLError as exc:
         raise ValueError(f"YAML parse error in {path}: {exc}") from exc
     if not isinstance(data, dict):
         raise ValueError(f"{path}: top-level YAML must be a mapping")
-    return data
+    return data, hashlib.blake2b(raw, digest_size=16).digest()
+
+
+@functools.cache
+def _log_pure_python_loader() -> None:
+    """Say once, on the first load rather than at import, that libyaml is missing."""
+    logger.info(
+        "libyaml not available; using the pure-Python YAML loader. "
+        "Install libyaml (e.g. libyaml-dev) and reinstall PyYAML for faster loads."
+    )
 
 
 def validate_skill(
@@ -67,17 +123,44 @@ def validate_skill(
 
     In strict mode, warnings are also raised as errors.
     """
-    data = load_yaml(path)
-    schema = _load_schema()
+    data, digest = _read_skill(path)
+    return _validate_data(data, path, strict, digest)
+
+
+def validate_skill_data(
+    data: dict[str, Any],
+    path: Path,
+    strict: bool = False,
+) -> list[ValidationWarning]:
+    """Validate an already-parsed skill dict against the JSON Schema.
+
+    Behaves like validate_skill without re-reading the file. path is used for
+    error messages and for the SKILL.md / artifact checks next to skill.yml;
+    it need not exist.
+    """
+    return _validate_data(data, path, strict, None)
 
-    validator = Draft202012Validator(schema, format_checker=FormatChecker())
-    raw_errors = sorted(validator.iter_errors(data), key=lambda e: list(e.path))
+
+def _validate_data(
+    data: dict[str, Any],
+    path: Path,
+    strict: bool,
+    digest: bytes | None,
+) -> list[ValidationWarning]:
+    """Shared body of validate_skill / validate_skill_data.
+
+    digest is set only when data was parsed from path by the caller, which
+    lets the SKILL.md freshness check use the render memo.
+    """
+    raw_errors = list(_get_validator().iter_errors(data))
+    if len(raw_errors) > 1:
+        raw_errors.sort(key=lambda e: tuple(e.path))
 
     if raw_errors:
         messages = [_format_jsonschema_error(e) for e in raw_errors]
         raise ValidationError(path, messages)
 
-    warnings = _collect_warnings(path, data)
+    warnings = _collect_warnings(path, data, digest)
 
     if strict and warnings:
         raise ValidationError(path, [w.message for w in warnings])
@@ -90,7 +173,9 @@ def _step_id(step: dict[str, Any]) -> str:
     return step.get("id") or step.get("activity", "?")
 
 
-def _collect_warnings(path: Path, data: dict[str, Any]) -> list[ValidationWarning]:
+def _collect_warnings(
+    path: Path, data: dict[str, Any], digest: bytes | None
+) -> list[ValidationWarning]:
     warnings: list[ValidationWarning] = []
     meta = data.get("metadata", {})
 
@@ -101,6 +186,7 @@ def _collect_warnings(path: Path, data: dict[str, Any]) -> list[ValidationWarnin
                 path,
                 "authorised_agents contains '*' — all agents are permitted. "
                 "Consider restricting to named agent IDs.",
+                "wildcard_agents",
             )
         )
 
@@ -108,11 +194,15 @@ def _collect_warnings(path: Path, data: dict[str, Any]) -> list[ValidationWarnin
     if status == "approved":
         if not meta.get("approved_at"):
             warnings.append(
-                ValidationWarning(path, "status is 'approved' but approved_at is null")
+                ValidationWarning(
+                    path, "status is 'approved' but approved_at is null", "approved_at_missing"
+                )
             )
         if not meta.get("approved_by"):
             warnings.append(
-                ValidationWarning(path, "status is 'approved' but approved_by is null")
+                ValidationWarning(
+                    path, "status is 'approved' but approved_by is null", "approved_by_missing"
+                )
             )
 
     # Cross-reference: workflow step activity IDs must exist in approved_activities
@@ -123,6 +213,7 @@ def _collect_warnings(path: Path, data: dict[str, Any]) -> list[ValidationWarnin
             warnings.append(ValidationWarning(
                 path,
                 f"Workflow step '{_step_id(step)}': activity '{activity}' not found in approved_activities",
+                "unknown_activity",
             ))
 
     # Rec 10: activation: step requires the control point to be referenced by a workflow step
@@ -137,35 +228,70 @@ def _collect_warnings(path: Path, data: dict[str, Any]) -> list[ValidationWarnin
                 path,
                 f"Control point '{cp['id']}' has activation: step but is not referenced "
                 f"by any workflow step via control_point",
+                "unreferenced_control_point",
             ))
 
     # Staleness check: only applies to directory-based skill.yml files
     if path.name == "skill.yml":
-        warnings.extend(_check_skill_md_freshness(path, data))
+        warnings.extend(_check_skill_md_freshness(path, data, digest))
         warnings.extend(_check_artifact_consistency(path, data))
 
     return warnings
 
 
-def _check_skill_md_freshness(path: Path, data: dict[str, Any]) -> list[ValidationWarning]:
-    """Warn if SKILL.md is missing or out of sync with the current render of skill.yml."""
+def _render(data: Mapping[str, Any], digest: bytes | None) -> str:
+    """Return render_skill_md(data), memoised on digest when one is given.
+
+    digest must be that of the bytes data was parsed from; without one the
+    dict is rendered directly.
+    """
     from supervisory_procedures.core.renderer import render_skill_md  # avoid circular at module level
 
+    if digest is None:
+        return render_skill_md(data)
+    rendered = _rendered.get(digest)
+    if rendered is None:
+        rendered = render_skill_md(data)
+        if len(_rendered) >= _RENDER_CACHE_SIZE:
+            _rendered.pop(next(iter(_rendered)))
+        _rendered[digest] = rendered
+    return rendered
+
+
+def validate_and_render(
+    path: Path,
+    strict: bool = False,
+) -> tuple[list[ValidationWarning], str]:
+    """Validate a skill file and return (warnings, rendered SKILL.md).
+
+    The SKILL.md freshness check and the returned markdown share one render.
+    Raises ValidationError like validate_skill.
+    """
+    data, digest = _read_skill(path)
+    warnings = _validate_data(data, path, strict, digest)
+    return warnings, _render(data, digest)
+
+
+def _check_skill_md_freshness(
+    path: Path, data: dict[str, Any], digest: bytes | None
+) -> list[ValidationWarning]:
+    """Warn if SKILL.md is missing or out of sync with the current render of skill.yml."""
     skill_md_path = path.parent / "SKILL.md"
 
     if not skill_md_path.exists():
         return [ValidationWarning(
             path,
             f"SKILL.md not found — run `supv render {data.get('metadata', {}).get('id', '')}` to generate it",
+            "skill_md_missing",
         )]
 
-    expected = render_skill_md(data)
-    actual = skill_md_path.read_text()
-
-    if actual.strip() != expected.strip():
+    # SKILL.md itself is always re-read: its mtime says nothing about whether
+    # it matches (git checkouts and hand edits both leave it "newer").
+    if skill_md_path.read_text().strip() != _render(data, digest).strip():
         return [ValidationWarning(
             path,
             f"SKILL.md is stale — run `supv render {data.get('metadata', {}).get('id', '')}` to regenerate it",
+            "skill_md_stale",
         )]
 
     return []
@@ -184,48 +310,62 @@ def _check_artifact_consistency(path: Path, data: dict[str, Any]) -> list[Valida
     skill_dir = path.parent
     registry_root = path.parent.parent.parent  # registry/<area>/<skill>/skill.yml
 
+    # One directory read each for the skill dir and resources/, instead of a
+    # stat per artifact path
+    entries = _scandir(skill_dir)
+    resources = _scandir(skill_dir / "resources") if "resources" in entries else {}
+
     # 1. Escalation contacts
-    escalation_contacts_path = skill_dir / "resources" / "escalation_contacts.md"
-    if escalation_contacts_path.exists():
-        contacts_text = escalation_contacts_path.read_text().lower()
+    if "escalation_contacts.md" in resources:
+        contacts_text = Path(resources["escalation_contacts.md"].path).read_text().lower()
+        # Substring match (contacts may be names with spaces, or sit next to
+        # punctuation), but each distinct contact is searched for only once
+        contact_found: dict[str, bool] = {}
         for cp in data.get("control_points", []):
             contact = cp.get("escalation_contact", "")
-            if contact and contact.lower() not in contacts_text:
+            if not contact:
+                continue
+            if contact not in contact_found:
+                contact_found[contact] = contact.lower() in contacts_text
+            if not contact_found[contact]:
                 warnings.append(ValidationWarning(
                     path,
                     f"Control point '{cp['id']}' escalation_contact '{contact}' "
                     f"not found in resources/escalation_contacts.md",
+                    "escalation_contact_not_listed",
                 ))
 
     # 2. Applicable regulations vs resources/regulations.md
-    regulations_path = skill_dir / "resources" / "regulations.md"
-    if regulations_path.exists():
-        regs_text = regulations_path.read_text()
+    if "regulations.md" in resources:
+        regs_text = Path(resources["regulations.md"].path).read_text().lower()
         for reg in data.get("context", {}).get("applicable_regulations", []):
             # Check for a keyword from the regulation string (first meaningful token)
             keyword = reg.split("—")[0].strip().split()[0] if reg else ""
-            if keyword and keyword.lower() not in regs_text.lower():
+            if keyword and keyword.lower() not in regs_text:
                 warnings.append(ValidationWarning(
                     path,
                     f"Regulation '{reg}' from context.applicable_regulations has no matching "
                     f"reference in resources/regulations.md",
+                    "regulation_not_referenced",
                 ))
 
-    # 3. Shared skill existence for uses_skill references
+    # 3. Shared skill existence for uses_skill references (each target stat'ed once)
+    uses_exists: dict[str, bool] = {}
     for step in data.get("workflow", {}).get("steps", []):
         uses = step.get("uses_skill", "")
         if uses:
-            shared_dir = registry_root / uses
-            if not shared_dir.exists():
+            if uses not in uses_exists:
+                uses_exists[uses] = (registry_root / uses).exists()
+            if not uses_exists[uses]:
                 warnings.append(ValidationWarning(
                     path,
                     f"Workflow step '{_step_id(step)}': uses_skill '{uses}' "
                     f"does not exist in registry/",
+                    "uses_skill_missing",
                 ))
 
     # 4. Unreferenced scripts
-    scripts_dir = skill_dir / "scripts"
-    if scripts_dir.exists():
+    if "scripts" in entries:
         declared_scripts: set[str] = set()
         for artifact_script in data.get("artifacts", {}).get("scripts", []):
             declared_scripts.add(artifact_script.get("file", ""))
@@ -236,23 +376,41 @@ def _check_artifact_consistency(path: Path, data: dict[str, Any]) -> list[Valida
             if aid:
                 referenced_in_activities.add(aid.replace("-", "_") + ".py")
 
-        for script_file in scripts_dir.glob("*.py"):
-            name = script_file.name
+        for name in _scandir(skill_dir / "scripts"):
+            if not name.endswith(".py"):
+                continue
             if name not in declared_scripts and name not in referenced_in_activities:
                 warnings.append(ValidationWarning(
                     path,
                     f"scripts/{name} is not referenced by any activity id or declared in artifacts.scripts",
+                    "unreferenced_script",
                 ))
 
     return warnings
 
 
+def _scandir(directory: Path) -> dict[str, os.DirEntry[str]]:
+    """Map entry names to DirEntry for directory; empty if it is missing or not a directory."""
+    try:
+        with os.scandir(directory) as it:
+            return {e.name: e for e in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
 def validate_directory(
     directory: Path,
     strict: bool = False,
+    fail_fast: bool = False,
 ) -> tuple[list[tuple[Path, list[ValidationWarning]]], list[ValidationError]]:
     """Validate all skill YAML files under directory recursively.
 
+    If fail_fast is True, validation stops at the first invalid file; skills
+    already validated are still returned in successes.
+
+    Set SUPV_PARALLEL=1 to spread files across a process pool (one worker per
+    CPU). Results are collected in path order, so output does not change.
+
     Returns:
         (successes, failures)
         successes: list of (path, warnings) for valid skills
@@ -261,18 +419,46 @@ def validate_directory(
     successes: list[tuple[Path, list[ValidationWarning]]] = []
     failures: list[ValidationError] = []
 
-    for yml_path in sorted(directory.rglob("*.yml")):
-        try:
-            warnings = validate_skill(yml_path, strict=strict)
-            successes.append((yml_path, warnings))
-        except ValidationError as exc:
-            failures.append(exc)
-        except ValueError as exc:
-            failures.append(ValidationError(yml_path, [str(exc)]))
+    paths = sorted(directory.rglob("*.yml"))
+    pool = None
+    if len(paths) > 1 and os.environ.get("SUPV_PARALLEL") == "1":
+        pool = ProcessPoolExecutor()
+        results = pool.map(_validate_one, paths, repeat(strict), chunksize=8)
+    else:
+        results = map(_validate_one, paths, repeat(strict))
+
+    try:
+        # Both maps yield in path order, so output is identical either way
+        for yml_path, (warnings, errors) in zip(paths, results):
+            if errors is None:
+                successes.append((yml_path, warnings))
+            else:
+                failures.append(ValidationError(yml_path, errors))
+            if fail_fast and failures:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
     return successes, failures
 
 
+def _validate_one(
+    path: Path, strict: bool
+) -> tuple[list[ValidationWarning], list[str] | None]:
+    """Validate one file for validate_directory; return (warnings, errors or None).
+
+    Errors are returned as plain strings rather than raised, so results
+    pickle cleanly back from worker processes.
+    """
+    try:
+        return validate_skill(path, strict=strict), None
+    except ValidationError as exc:
+        return [], exc.errors
+    except ValueError as exc:
+        return [], [str(exc)]
+
+
 def _format_jsonschema_error(error: jsonschema.ValidationError) -> str:
     path = " -> ".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
     return f"[{path}] {error.message}"
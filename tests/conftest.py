@@ -0,0 +1,84 @@
+"""Shared pytest fixtures."""
+
+import copy
+import functools
+from pathlib import Path
+
+import pytest
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+from supervisory_procedures.core.registry import SkillRegistry
+from supervisory_procedures.core.validator import _get_validator, validate_directory
+
+FIXTURES = Path(__file__).parent / "fixtures"
+REGISTRY = Path(__file__).parent.parent / "registry"
+
+
+@functools.cache
+def _parse(filename: str) -> dict:
+    return yaml.load((FIXTURES / filename).read_bytes(), Loader=_Loader)
+
+
+def _load(filename: str) -> dict:
+    """A fresh copy of a fixture skill: parsed once, deep-copied per test."""
+    return copy.deepcopy(_parse(filename))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_validator() -> None:
+    """Build the cached schema validator up front so no single test pays for it."""
+    _get_validator()
+
+
+@pytest.fixture
+def valid_skill() -> dict:
+    return _load("valid_skill.yml")
+
+
+@pytest.fixture
+def draft_skill() -> dict:
+    return _load("draft_skill.yml")
+
+
+@pytest.fixture
+def wildcard_skill() -> dict:
+    return _load("wildcard_agents_skill.yml")
+
+
+@pytest.fixture(scope="session")
+def production_registry() -> SkillRegistry:
+    """The bundled registry, loaded once; only hand it to tests that do not reload it."""
+    registry = SkillRegistry()
+    registry.load()
+    return registry
+
+
+@pytest.fixture(scope="session")
+def prebuilt_skill_dirs(tmp_path_factory) -> Path:
+    """A small on-disk registry (valid, draft and invalid skills) shared read-only."""
+    root = tmp_path_factory.mktemp("registry")
+    for name, fixture in (
+        ("test-skill", "valid_skill.yml"),
+        ("draft-skill", "draft_skill.yml"),
+        ("invalid-skill", "invalid_skill_missing_fields.yml"),
+    ):
+        skill_dir = root / "test_area" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "skill.yml").write_bytes((FIXTURES / fixture).read_bytes())
+    return root
+
+
+@pytest.fixture(scope="session")
+def fixtures_validation() -> tuple:
+    """validate_directory(FIXTURES), run once for the read-only directory tests."""
+    return validate_directory(FIXTURES)
+
+
+@pytest.fixture(scope="session")
+def registry_validation() -> tuple:
+    return validate_directory(REGISTRY)
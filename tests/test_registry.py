@@ -10,7 +10,7 @@ from supervisory_procedures.core.access_control import (
     SkillNotApprovedError,
     SkillNotFoundError,
 )
-from supervisory_procedures.core.registry import SkillRegistry
+from supervisory_procedures.core.registry import SkillRegistry, thaw
 
 FIXTURES = Path(__file__).parent / "fixtures"
 REGISTRY = Path(__file__).parent.parent / "registry"
@@ -22,27 +22,61 @@ class TestSkillRegistryLoad:
         reg.load()
         assert len(reg) > 0
 
-    def test_loads_from_custom_path(self, tmp_path):
+    def test_loads_from_custom_path(self, prebuilt_skill_dirs):
         # Skills must be directory-based (skill.yml inside a named directory)
-        dest = tmp_path / "test_area" / "test-skill" / "skill.yml"
-        dest.parent.mkdir(parents=True)
-        dest.write_text((FIXTURES / "valid_skill.yml").read_text())
+        reg = SkillRegistry(registry_path=prebuilt_skill_dirs)
+        reg.load()
+        assert "test_area/test-skill" in reg
+
+    def test_skips_invalid_skills(self, prebuilt_skill_dirs):
+        reg = SkillRegistry(registry_path=prebuilt_skill_dirs)
+        reg.load()
+        # invalid-skill is dropped; the valid and draft skills load
+        assert [s["id"] for s in reg.list_skills()] == [
+            "test_area/draft-skill",
+            "test_area/test-skill",
+        ]
+
+    def test_loads_many_skills(self, tmp_path):
+        template = (FIXTURES / "valid_skill.yml").read_text()
+        for i in range(6):
+            dest = tmp_path / "test_area" / f"skill-{i}" / "skill.yml"
+            dest.parent.mkdir(parents=True)
+            dest.write_text(
+                template.replace("id: test_area/test-skill", f"id: test_area/skill-{i}")
+            )
         reg = SkillRegistry(registry_path=tmp_path)
         reg.load()
-        assert len(reg) == 1
+        assert len(reg) == 6
+        skill_dir = reg.get_skill("test_area/skill-3")["_skill_dir"]
+        assert skill_dir == str(dest.parent.parent / "skill-3")
+
+    def test_ignores_hidden_and_cache_dirs(self, tmp_path):
+        template = (FIXTURES / "valid_skill.yml").read_text()
+        for hidden in (".git", "__pycache__"):
+            dest = tmp_path / hidden / "test_area" / "test-skill" / "skill.yml"
+            dest.parent.mkdir(parents=True)
+            dest.write_text(template)
+        reg = SkillRegistry(registry_path=tmp_path)
+        reg.load()
+        assert len(reg) == 0
 
-    def test_skips_invalid_skills(self, tmp_path):
-        valid_dir = tmp_path / "test_area" / "valid-skill"
-        valid_dir.mkdir(parents=True)
-        (valid_dir / "skill.yml").write_text((FIXTURES / "valid_skill.yml").read_text())
+    def test_same_size_edit_with_restored_mtime_is_revalidated(self, tmp_path):
+        import os
 
-        invalid_dir = tmp_path / "test_area" / "invalid-skill"
-        invalid_dir.mkdir(parents=True)
-        (invalid_dir / "skill.yml").write_text((FIXTURES / "invalid_skill_missing_fields.yml").read_text())
+        dest = tmp_path / "test_area" / "test-skill" / "skill.yml"
+        dest.parent.mkdir(parents=True)
+        dest.write_text((FIXTURES / "valid_skill.yml").read_text())
+        SkillRegistry(registry_path=tmp_path).load()
 
-        reg = SkillRegistry(registry_path=tmp_path)
-        reg.load()
-        assert len(reg) == 1
+        st = dest.stat()
+        # Same length, invalid enum value
+        edited = dest.read_text().replace("risk_classification: low", "risk_classification: xxx")
+        dest.write_text(edited)
+        os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert dest.stat().st_size == st.st_size
+
+        assert "test_area/test-skill" not in SkillRegistry(registry_path=tmp_path)
 
     def test_load_is_cached(self):
         reg = SkillRegistry()
@@ -57,84 +91,114 @@ class TestSkillRegistryLoad:
         reg.load(force_reload=True)  # should not error
         assert len(reg) > 0
 
-    def test_contains(self):
-        reg = SkillRegistry()
-        assert "retail_banking/loan-application-processing" in reg
+    def test_force_reload_picks_up_changes_and_deletions(self, tmp_path):
+        template = (FIXTURES / "valid_skill.yml").read_text()
+        paths = []
+        for i in range(2):
+            dest = tmp_path / "test_area" / f"skill-{i}" / "skill.yml"
+            dest.parent.mkdir(parents=True)
+            dest.write_text(
+                template.replace("id: test_area/test-skill", f"id: test_area/skill-{i}")
+            )
+            paths.append(dest)
+        reg = SkillRegistry(registry_path=tmp_path)
+        reg.load()
+        unchanged = reg.get_skill("test_area/skill-0")
+
+        paths[1].unlink()
+        new = tmp_path / "test_area" / "skill-2" / "skill.yml"
+        new.parent.mkdir()
+        new.write_text(template.replace("id: test_area/test-skill", "id: test_area/skill-2"))
+        reg.load(force_reload=True)
+
+        assert "test_area/skill-1" not in reg
+        assert "test_area/skill-2" in reg
+        # Unmodified files are not re-parsed
+        assert reg.get_skill("test_area/skill-0") is unchanged
+
+    def test_contains(self, production_registry):
+        assert "retail_banking/loan-application-processing" in production_registry
 
 
 class TestSkillRegistryGetSkill:
-    def test_get_approved_skill_without_agent_id(self):
-        reg = SkillRegistry()
-        skill = reg.get_skill("retail_banking/loan-application-processing")
+    def test_get_approved_skill_without_agent_id(self, production_registry):
+        skill = production_registry.get_skill("retail_banking/loan-application-processing")
         assert skill["metadata"]["id"] == "retail_banking/loan-application-processing"
 
-    def test_get_approved_skill_with_authorised_agent(self):
-        reg = SkillRegistry()
-        skill = reg.get_skill(
+    def test_get_approved_skill_with_authorised_agent(self, production_registry):
+        skill = production_registry.get_skill(
             "retail_banking/loan-application-processing",
             agent_id="loan-processor-agent-prod",
         )
         assert skill is not None
 
-    def test_get_skill_with_unauthorised_agent_raises(self):
-        reg = SkillRegistry()
+    def test_get_skill_with_unauthorised_agent_raises(self, production_registry):
         with pytest.raises(AgentNotAuthorisedError):
-            reg.get_skill(
+            production_registry.get_skill(
                 "retail_banking/loan-application-processing",
                 agent_id="rogue-agent",
             )
 
-    def test_get_nonexistent_skill_raises(self):
-        reg = SkillRegistry()
+    def test_get_nonexistent_skill_raises(self, production_registry):
         with pytest.raises(SkillNotFoundError):
-            reg.get_skill("nonexistent/skill")
+            production_registry.get_skill("nonexistent/skill")
 
-    def test_draft_skill_blocked_by_agent_id(self, tmp_path):
-        skill_dir = tmp_path / "test_area" / "draft-skill"
-        skill_dir.mkdir(parents=True)
-        (skill_dir / "skill.yml").write_text((FIXTURES / "draft_skill.yml").read_text())
-        reg = SkillRegistry(registry_path=tmp_path)
+    def test_draft_skill_blocked_by_agent_id(self, prebuilt_skill_dirs):
+        reg = SkillRegistry(registry_path=prebuilt_skill_dirs)
         with pytest.raises(SkillNotApprovedError):
             reg.get_skill("test_area/draft-skill", agent_id="test-agent-dev")
 
-    def test_get_skill_returns_full_dict(self):
-        reg = SkillRegistry()
-        skill = reg.get_skill("retail_banking/loan-application-processing")
+    def test_get_skill_returns_full_dict(self, production_registry):
+        skill = production_registry.get_skill("retail_banking/loan-application-processing")
         assert "context" in skill
         assert "approved_activities" in skill
         assert "constraints" in skill
         assert "control_points" in skill
 
+    def test_get_skill_is_read_only(self, production_registry):
+        skill = production_registry.get_skill("retail_banking/loan-application-processing")
+        with pytest.raises(TypeError):
+            skill["metadata"]["status"] = "draft"
+        assert isinstance(skill["approved_activities"], tuple)
+
+    def test_thaw_returns_mutable_copy(self, production_registry):
+        skill_id = "retail_banking/loan-application-processing"
+        skill = thaw(production_registry.get_skill(skill_id))
+        skill["metadata"]["status"] = "draft"
+        assert isinstance(skill["approved_activities"], list)
+        assert production_registry.get_skill(skill_id)["metadata"]["status"] == "approved"
+
 
 class TestSkillRegistryListSkills:
-    def test_list_all_skills(self):
-        reg = SkillRegistry()
-        skills = reg.list_skills()
+    def test_list_all_skills(self, production_registry):
+        skills = production_registry.list_skills()
         assert len(skills) > 0
 
-    def test_list_by_business_area(self):
-        reg = SkillRegistry()
-        skills = reg.list_skills(business_area="retail_banking")
+    def test_list_by_business_area(self, production_registry):
+        skills = production_registry.list_skills(business_area="retail_banking")
         assert all(s["business_area"] == "retail_banking" for s in skills)
 
-    def test_list_by_status(self):
-        reg = SkillRegistry()
-        skills = reg.list_skills(status="approved")
+    def test_list_by_status(self, production_registry):
+        skills = production_registry.list_skills(status="approved")
         assert all(s["status"] == "approved" for s in skills)
 
-    def test_list_nonexistent_area_returns_empty(self):
-        reg = SkillRegistry()
-        skills = reg.list_skills(business_area="nonexistent_area")
+    def test_list_by_business_area_and_status(self, production_registry):
+        skills = production_registry.list_skills(business_area="retail_banking", status="approved")
+        assert skills
+        assert all(
+            s["business_area"] == "retail_banking" and s["status"] == "approved" for s in skills
+        )
+
+    def test_list_nonexistent_area_returns_empty(self, production_registry):
+        skills = production_registry.list_skills(business_area="nonexistent_area")
         assert skills == []
 
-    def test_list_includes_risk_classification(self):
-        reg = SkillRegistry()
-        skills = reg.list_skills()
+    def test_list_includes_risk_classification(self, production_registry):
+        skills = production_registry.list_skills()
         for s in skills:
             assert "risk_classification" in s
 
-    def test_list_results_are_sorted(self):
-        reg = SkillRegistry()
-        skills = reg.list_skills()
+    def test_list_results_are_sorted(self, production_registry):
+        skills = production_registry.list_skills()
         ids = [s["id"] for s in skills]
         assert ids == sorted(ids)
@@ -1,18 +1,27 @@
 """Tests for supervisory_procedures.core.validator."""
 
+import os
 from pathlib import Path
 
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 from supervisory_procedures.core.validator import (
     ValidationError,
     ValidationWarning,
+    validate_and_render,
     validate_directory,
     validate_skill,
+    validate_skill_data,
 )
 
 FIXTURES = Path(__file__).parent / "fixtures"
+REGISTRY = Path(__file__).parent.parent / "registry"
 
 
 class TestValidateSkill:
@@ -28,7 +37,7 @@ class TestValidateSkill:
 
     def test_wildcard_agents_produces_warning(self):
         warnings = validate_skill(FIXTURES / "wildcard_agents_skill.yml")
-        assert any("wildcard" in w.message.lower() or "*" in w.message for w in warnings)
+        assert any(w.code == "wildcard_agents" for w in warnings)
 
     def test_wildcard_agents_strict_raises(self):
         with pytest.raises(ValidationError) as exc_info:
@@ -38,7 +47,7 @@ class TestValidateSkill:
     def test_valid_skill_no_warnings(self):
         warnings = validate_skill(FIXTURES / "valid_skill.yml")
         # valid_skill.yml uses named agents so no wildcard warning
-        wildcard_warnings = [w for w in warnings if "*" in w.message]
+        wildcard_warnings = [w for w in warnings if w.code == "wildcard_agents"]
         assert len(wildcard_warnings) == 0
 
     def test_draft_skill_validates_schema(self):
@@ -47,38 +56,143 @@ class TestValidateSkill:
         assert isinstance(warnings, list)
 
     def test_loan_application_processing_valid(self):
-        registry = Path(__file__).parent.parent / "registry"
-        skill_path = registry / "retail_banking" / "loan-application-processing" / "skill.yml"
+        skill_path = REGISTRY / "retail_banking" / "loan-application-processing" / "skill.yml"
         warnings = validate_skill(skill_path)
         assert isinstance(warnings, list)
 
+    def test_validate_skill_data_matches_file_validation(self):
+        path = FIXTURES / "wildcard_agents_skill.yml"
+        data = yaml.load(path.read_bytes(), Loader=_Loader)
+        from_file = [w.message for w in validate_skill(path)]
+        from_data = [w.message for w in validate_skill_data(data, path)]
+        assert from_data == from_file
+
+    def test_validate_skill_data_invalid_raises(self):
+        path = FIXTURES / "invalid_skill_missing_fields.yml"
+        with pytest.raises(ValidationError) as exc_info:
+            validate_skill_data(yaml.load(path.read_bytes(), Loader=_Loader), path)
+        assert exc_info.value.path == path
+
+    def test_skill_md_freshness_render_is_memoised(self, tmp_path, monkeypatch):
+        from supervisory_procedures.core import renderer
+
+        skill_dir = tmp_path / "test_area" / "test-skill"
+        skill_dir.mkdir(parents=True)
+        skill_yml = skill_dir / "skill.yml"
+        skill_yml.write_text((FIXTURES / "valid_skill.yml").read_text() + "\n# memo test\n")
+        data = yaml.load(skill_yml.read_bytes(), Loader=_Loader)
+        (skill_dir / "SKILL.md").write_text(renderer.render_skill_md(data))
+
+        calls = []
+        real = renderer.render_skill_md
+        monkeypatch.setattr(renderer, "render_skill_md", lambda d: calls.append(1) or real(d))
+        for _ in range(2):
+            warnings = validate_skill(skill_yml)
+            assert not any("SKILL.md" in w.message for w in warnings)
+        assert len(calls) == 1
+
+    def test_same_size_edit_with_restored_mtime_is_stale(self, tmp_path):
+        from supervisory_procedures.core.renderer import render_skill_md
+
+        skill_dir = tmp_path / "test_area" / "test-skill"
+        skill_dir.mkdir(parents=True)
+        skill_yml = skill_dir / "skill.yml"
+        text = (FIXTURES / "valid_skill.yml").read_text()
+        skill_yml.write_text(text)
+        (skill_dir / "SKILL.md").write_text(
+            render_skill_md(yaml.load(skill_yml.read_bytes(), Loader=_Loader))
+        )
+        assert not any(w.code == "skill_md_stale" for w in validate_skill(skill_yml))
+
+        st = skill_yml.stat()
+        skill_yml.write_text(text.replace("name: Test Skill", "name: Tset Skill"))
+        os.utime(skill_yml, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert skill_yml.stat().st_size == st.st_size
+        assert any(w.code == "skill_md_stale" for w in validate_skill(skill_yml))
+
+    def test_edited_dict_is_rendered_not_served_from_memo(self, tmp_path):
+        from supervisory_procedures.core.renderer import render_skill_md
+
+        skill_dir = tmp_path / "test_area" / "test-skill"
+        skill_dir.mkdir(parents=True)
+        skill_yml = skill_dir / "skill.yml"
+        skill_yml.write_text((FIXTURES / "valid_skill.yml").read_text())
+        data = yaml.load(skill_yml.read_bytes(), Loader=_Loader)
+        (skill_dir / "SKILL.md").write_text(render_skill_md(data))
+        assert not any(w.code == "skill_md_stale" for w in validate_skill(skill_yml))
+
+        data["metadata"]["name"] = "Edited in memory"
+        warnings = validate_skill_data(data, skill_yml)
+        assert any(w.code == "skill_md_stale" for w in warnings)
+
+    def test_skill_data_validates_before_skill_yml_exists(self, tmp_path):
+        from supervisory_procedures.core.renderer import render_skill_md
+
+        skill_dir = tmp_path / "test_area" / "test-skill"
+        skill_dir.mkdir(parents=True)
+        data = yaml.load((FIXTURES / "valid_skill.yml").read_bytes(), Loader=_Loader)
+        (skill_dir / "SKILL.md").write_text(render_skill_md(data))
+        warnings = validate_skill_data(data, skill_dir / "skill.yml")
+        assert not any(w.code.startswith("skill_md") for w in warnings)
+
+    def test_validate_and_render_returns_warnings_and_markdown(self):
+        from supervisory_procedures.core.renderer import render_skill_md
+
+        path = FIXTURES / "wildcard_agents_skill.yml"
+        warnings, rendered = validate_and_render(path)
+        assert [w.message for w in warnings] == [w.message for w in validate_skill(path)]
+        assert rendered == render_skill_md(yaml.load(path.read_bytes(), Loader=_Loader))
+
+    def test_hand_edited_skill_md_is_stale_despite_newer_mtime(self, tmp_path):
+        skill_dir = tmp_path / "test_area" / "test-skill"
+        skill_dir.mkdir(parents=True)
+        skill_yml = skill_dir / "skill.yml"
+        skill_yml.write_text((FIXTURES / "valid_skill.yml").read_text())
+        (skill_dir / "SKILL.md").write_text("hand-edited\n")  # written after skill.yml
+        warnings = validate_skill(skill_yml)
+        assert any(w.code == "skill_md_stale" for w in warnings)
+
     def test_missing_file_raises_error(self):
         with pytest.raises((FileNotFoundError, ValueError)):
             validate_skill(Path("/nonexistent/path/skill.yml"))
 
 
 class TestValidateDirectory:
-    def test_validates_all_files(self):
-        successes, failures = validate_directory(FIXTURES)
+    def test_validates_all_files(self, fixtures_validation):
+        successes, failures = fixtures_validation
         # Should find valid fixtures and invalid ones
         assert len(successes) + len(failures) > 0
 
-    def test_invalid_fixture_in_failures(self):
-        _, failures = validate_directory(FIXTURES)
+    def test_invalid_fixture_in_failures(self, fixtures_validation):
+        _, failures = fixtures_validation
         failure_paths = [f.path for f in failures]
         assert any("invalid" in p.name for p in failure_paths)
 
-    def test_valid_fixture_in_successes(self):
-        successes, _ = validate_directory(FIXTURES)
+    def test_valid_fixture_in_successes(self, fixtures_validation):
+        successes, _ = fixtures_validation
         success_paths = [p for p, _ in successes]
         assert any("valid_skill" in p.name for p in success_paths)
 
-    def test_registry_validates_cleanly(self):
-        registry = Path(__file__).parent.parent / "registry"
-        successes, failures = validate_directory(registry)
+    def test_registry_validates_cleanly(self, registry_validation):
+        successes, failures = registry_validation
         # The production registry should have no validation failures
         assert failures == [], f"Registry validation failures: {failures}"
 
+    def test_fail_fast_stops_at_first_failure(self):
+        successes, failures = validate_directory(FIXTURES, fail_fast=True)
+        assert len(failures) == 1
+        # Files sorted before the failing one are still reported
+        assert all(p.name < failures[0].path.name for p, _ in successes)
+
+    def test_parallel_matches_serial(self, monkeypatch, fixtures_validation):
+        serial = fixtures_validation
+        monkeypatch.setenv("SUPV_PARALLEL", "1")
+        parallel = validate_directory(FIXTURES)
+        assert [(p, [w.message for w in ws]) for p, ws in parallel[0]] == [
+            (p, [w.message for w in ws]) for p, ws in serial[0]
+        ]
+        assert [(e.path, e.errors) for e in parallel[1]] == [(e.path, e.errors) for e in serial[1]]
+
     def test_empty_directory_returns_empty(self, tmp_path):
         successes, failures = validate_directory(tmp_path)
         assert successes == []
@@ -99,129 +213,95 @@ class TestValidationError:
         assert exc.errors == errors
 
 
-class TestSchemaConstraints:
-    """Test that the schema correctly rejects specific invalid inputs."""
-
-    def _make_skill(self, overrides: dict) -> dict:
-        """Return a minimal valid skill dict, with overrides applied."""
-        import copy
-        base = yaml.safe_load((FIXTURES / "valid_skill.yml").read_text())
-        # Deep-merge overrides
-        for key, val in overrides.items():
-            if isinstance(val, dict) and isinstance(base.get(key), dict):
-                base[key].update(val)
-            else:
-                base[key] = val
-        return base
-
-    def test_invalid_status_rejected(self, tmp_path):
-        skill = self._make_skill({"metadata": {"status": "pending"}})
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        with pytest.raises(ValidationError):
-            validate_skill(path)
-
-    def test_invalid_schema_version_rejected(self, tmp_path):
-        skill = self._make_skill({"metadata": {"schema_version": "99.0"}})
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        with pytest.raises(ValidationError):
-            validate_skill(path)
-
-    def test_empty_approved_activities_rejected(self, tmp_path):
-        skill = self._make_skill({"approved_activities": []})
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        with pytest.raises(ValidationError):
-            validate_skill(path)
-
-    def test_empty_control_points_rejected(self, tmp_path):
-        skill = self._make_skill({"control_points": []})
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        with pytest.raises(ValidationError):
-            validate_skill(path)
-
-    def test_invalid_classification_rejected(self, tmp_path):
-        skill = self._make_skill({
-            "control_points": [{
-                "id": "test",
-                "description": "test",
-                "classification": "do_nothing",
+def _apply_overrides(base: dict, overrides: dict) -> dict:
+    """Return *base* with *overrides* merged in one level deep.
+
+    Only the top-level dict and the overridden sections are new objects; all
+    other sections are shared with *base*, so callers must not mutate them.
+    """
+    skill = dict(base)
+    for key, val in overrides.items():
+        if isinstance(val, dict) and isinstance(base.get(key), dict):
+            skill[key] = {**base[key], **val}
+        else:
+            skill[key] = val
+    return skill
+
+
+_REJECTED = {
+    "invalid_status": {"metadata": {"status": "pending"}},
+    "invalid_schema_version": {"metadata": {"schema_version": "99.0"}},
+    "empty_approved_activities": {"approved_activities": []},
+    "empty_control_points": {"control_points": []},
+    "invalid_classification": {
+        "control_points": [{
+            "id": "test",
+            "description": "test",
+            "classification": "do_nothing",
+            "activation": "step",
+        }]
+    },
+    # Rec 11: vetoed control point must have escalation_contact.
+    "vetoed_without_escalation_contact": {
+        "control_points": [{
+            "id": "test-veto",
+            "description": "A vetoed control point.",
+            "classification": "vetoed",
+            "activation": "conditional",
+            "trigger": "Something bad happened.",
+            # escalation_contact intentionally omitted
+        }]
+    },
+    # Rec 11: needs_approval control point must have who_reviews.
+    "needs_approval_without_who_reviews": {
+        "control_points": [
+            # Keep a vetoed cp to satisfy the base schema
+            {
+                "id": "error-threshold-exceeded",
+                "description": "Errors exceeded.",
+                "classification": "vetoed",
+                "activation": "conditional",
+                "trigger": "Errors exceeded.",
+                "escalation_contact": "ops@example.com",
+            },
+            {
+                "id": "test-approval",
+                "description": "Needs approval.",
+                "classification": "needs_approval",
                 "activation": "step",
-            }]
-        })
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        with pytest.raises(ValidationError):
-            validate_skill(path)
-
-    def test_vetoed_without_escalation_contact_rejected(self, tmp_path):
-        """Rec 11: vetoed control point must have escalation_contact."""
-        skill = self._make_skill({
-            "control_points": [{
-                "id": "test-veto",
-                "description": "A vetoed control point.",
+                # who_reviews intentionally omitted
+            },
+        ]
+    },
+    # Rec 10: activation: conditional requires trigger field.
+    "conditional_activation_without_trigger": {
+        "control_points": [
+            {
+                "id": "test-conditional",
+                "description": "A conditional control point.",
                 "classification": "vetoed",
                 "activation": "conditional",
-                "trigger": "Something bad happened.",
-                # escalation_contact intentionally omitted
-            }]
-        })
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        with pytest.raises(ValidationError):
-            validate_skill(path)
+                "escalation_contact": "ops@example.com",
+                # trigger intentionally omitted
+            },
+        ]
+    },
+}
 
-    def test_needs_approval_without_who_reviews_rejected(self, tmp_path):
-        """Rec 11: needs_approval control point must have who_reviews."""
-        skill = self._make_skill({
-            "control_points": [
-                # Keep a vetoed cp to satisfy the base schema
-                {
-                    "id": "error-threshold-exceeded",
-                    "description": "Errors exceeded.",
-                    "classification": "vetoed",
-                    "activation": "conditional",
-                    "trigger": "Errors exceeded.",
-                    "escalation_contact": "ops@example.com",
-                },
-                {
-                    "id": "test-approval",
-                    "description": "Needs approval.",
-                    "classification": "needs_approval",
-                    "activation": "step",
-                    # who_reviews intentionally omitted
-                },
-            ]
-        })
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        with pytest.raises(ValidationError):
-            validate_skill(path)
 
-    def test_conditional_activation_without_trigger_rejected(self, tmp_path):
-        """Rec 10: activation: conditional requires trigger field."""
-        skill = self._make_skill({
-            "control_points": [
-                {
-                    "id": "test-conditional",
-                    "description": "A conditional control point.",
-                    "classification": "vetoed",
-                    "activation": "conditional",
-                    "escalation_contact": "ops@example.com",
-                    # trigger intentionally omitted
-                },
-            ]
-        })
+class TestSchemaConstraints:
+    """Test that the schema correctly rejects specific invalid inputs."""
+
+    @pytest.mark.parametrize("overrides", list(_REJECTED.values()), ids=list(_REJECTED))
+    def test_invalid_input_rejected(self, tmp_path, valid_skill, overrides):
         path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        with pytest.raises(ValidationError):
-            validate_skill(path)
+        with pytest.raises(ValidationError) as exc_info:
+            validate_skill_data(_apply_overrides(valid_skill, overrides), path)
+        assert exc_info.value.path == path
 
-    def test_step_activation_unreferenced_produces_warning(self, tmp_path):
+    def test_step_activation_unreferenced_produces_warning(self, tmp_path, valid_skill):
         """Rec 10: activation: step control point not referenced by any workflow step warns."""
-        skill = self._make_skill({
+        skill = _apply_overrides(valid_skill, {
             "control_points": [
                 {
                     "id": "error-threshold-exceeded",
@@ -240,42 +320,36 @@ class TestSchemaConstraints:
                 },
             ]
         })
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        warnings = validate_skill(path)
+        warnings = validate_skill_data(skill, tmp_path / "skill.yml")
         assert any("unreferenced-review" in w.message for w in warnings)
 
-    def test_lifecycle_fields_optional(self, tmp_path):
+    def test_lifecycle_fields_optional(self, tmp_path, valid_skill):
         """Rec 3: created_at, approved_at, approved_by are not required from authors."""
-        skill = self._make_skill({})
-        # Remove lifecycle fields — schema should still accept the skill
+        skill = _apply_overrides(valid_skill, {"metadata": {}})
+        # Remove lifecycle fields from the copied metadata — schema should still accept the skill
         skill["metadata"].pop("created_at", None)
         skill["metadata"].pop("approved_at", None)
         skill["metadata"].pop("approved_by", None)
         skill["metadata"]["status"] = "draft"
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
         # Should not raise — lifecycle fields are optional
-        warnings = validate_skill(path)
+        warnings = validate_skill_data(skill, tmp_path / "skill.yml")
         assert isinstance(warnings, list)
 
-    def test_step_id_optional(self, tmp_path):
+    def test_step_id_optional(self, tmp_path, valid_skill):
         """Rec 4: workflow step id is optional; activity id is used as fallback."""
-        skill = self._make_skill({
+        skill = _apply_overrides(valid_skill, {
             "workflow": {
                 "steps": [
                     {"activity": "run-query", "control_point": "initial-review"},
                 ]
             }
         })
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        warnings = validate_skill(path)
+        warnings = validate_skill_data(skill, tmp_path / "skill.yml")
         assert isinstance(warnings, list)
 
-    def test_control_point_name_optional(self, tmp_path):
+    def test_control_point_name_optional(self, tmp_path, valid_skill):
         """Rec 7: control point name is optional."""
-        skill = self._make_skill({
+        skill = _apply_overrides(valid_skill, {
             "control_points": [
                 {
                     "id": "error-threshold-exceeded",
@@ -296,7 +370,5 @@ class TestSchemaConstraints:
                 },
             ]
         })
-        path = tmp_path / "skill.yml"
-        path.write_text(yaml.dump(skill))
-        warnings = validate_skill(path)
+        warnings = validate_skill_data(skill, tmp_path / "skill.yml")
         assert isinstance(warnings, list)
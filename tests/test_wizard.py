@@ -0,0 +1,66 @@
+"""Tests for `supv new` (supervisory_procedures.cli.wizard)."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from supervisory_procedures.cli.wizard import _sla_validate, new
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _run(tmp_path: Path, text: str):
+    src = tmp_path / "draft.yml"
+    src.write_text(text)
+    registry = tmp_path / "reg"
+    result = CliRunner().invoke(
+        new, ["--registry", str(registry), "--from-file", str(src), "--no-preview"]
+    )
+    return result, registry
+
+
+class TestNewFromFile:
+    def test_valid_file_is_saved(self, tmp_path):
+        result, registry = _run(tmp_path, (FIXTURES / "valid_skill.yml").read_text())
+        assert result.exit_code == 0, result.output
+        assert (registry / "test_area" / "test-skill" / "skill.yml").is_file()
+
+    def test_source_is_saved_verbatim(self, tmp_path):
+        text = "# Reviewed by the desk, 2026-10\n" + (FIXTURES / "valid_skill.yml").read_text()
+        result, registry = _run(tmp_path, text)
+        assert result.exit_code == 0, result.output
+        assert (registry / "test_area" / "test-skill" / "skill.yml").read_text() == text
+
+    def test_invalid_file_is_not_saved(self, tmp_path):
+        text = (FIXTURES / "valid_skill.yml").read_text().replace(
+            "status: approved", "status: pending"
+        )
+        result, registry = _run(tmp_path, text)
+        assert result.exit_code == 1
+        assert not registry.exists()
+
+    def test_id_outside_registry_is_refused(self, tmp_path):
+        text = (FIXTURES / "valid_skill.yml").read_text().replace(
+            "id: test_area/test-skill", "id: ../../escaped/x"
+        )
+        result, _ = _run(tmp_path, text)
+        assert result.exit_code == 1
+        assert not (tmp_path.parent / "escaped").exists()
+        assert not (tmp_path / "escaped").exists()
+
+    def test_non_mapping_metadata_is_refused(self, tmp_path):
+        result, registry = _run(tmp_path, "metadata: [not, a, mapping]\n")
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
+        assert not registry.exists()
+
+
+class TestSlaPrompt:
+    @pytest.mark.parametrize("value", ["", "1", " 24 "])
+    def test_blank_or_positive_accepted(self, value):
+        assert _sla_validate(value) is True
+
+    @pytest.mark.parametrize("value", ["0", "-3", "+5", "1_000", "2.5", "abc"])
+    def test_other_input_rejected(self, value):
+        assert isinstance(_sla_validate(value), str)